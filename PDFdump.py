@@ -1,10 +1,51 @@
 from pathlib import Path
 import pdfplumber
-import unicodedata
+import binascii
+import mmap
 import os
-import re
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from pdfplumber.utils.text import WordExtractor
+
+from bpauto.pdf_scanner import normalize_text  # same normalisation the extractors see
 
 """PDFdump.py - A utility to dump PDF structure and raw bytes for analysis. Only to check the PDF structure of documents, not to extract fields. For debunging purposes only."""
+# printable ASCII stays, everything else becomes '.' (used with bytes.translate)
+_ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+_BLOCK_LINES = 4096  # dump lines formatted per vectorized call
+# lookup tables for the numpy kernel
+_HEX_LUT = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+_ASCII_LUT = np.frombuffer(_ASCII_TABLE, dtype=np.uint8)
+# same settings as extract_text(x_tolerance=2, y_tolerance=2) / extract_words(...)
+_WORDS = WordExtractor(x_tolerance=2, y_tolerance=2)
+
+
+def _format_line(off: int, chunk: bytes, width: int) -> str:
+    hex_part = binascii.hexlify(chunk, b" ").decode("ascii").upper()
+    ascii_part = chunk.translate(_ASCII_TABLE).decode("latin-1")
+    return f"{off:08X}  {hex_part:<{width*3}}  {ascii_part}\n"
+
+
+def _format_full_lines(buf: bytes, base: int, width: int) -> str:
+    """
+    Vectorized version of _format_line for len(buf) // width complete lines:
+    all lines of the block are written into one uint8 array via lookup tables.
+    """
+    n = len(buf) // width
+    data = np.frombuffer(buf, dtype=np.uint8, count=n * width).reshape(n, width)
+    hex_col = 10  # after "OOOOOOOO  "
+    ascii_col = hex_col + 3 * width + 2
+    out = np.full((n, ascii_col + width + 1), ord(" "), dtype=np.uint8)
+    offsets = base + np.arange(n, dtype=np.uint64) * np.uint64(width)
+    for k in range(8):
+        out[:, k] = _HEX_LUT[(offsets >> np.uint64(4 * (7 - k))) & np.uint64(0xF)]
+    out[:, hex_col : hex_col + 3 * width : 3] = _HEX_LUT[data >> 4]
+    out[:, hex_col + 1 : hex_col + 3 * width : 3] = _HEX_LUT[data & 0xF]
+    out[:, ascii_col : ascii_col + width] = _ASCII_LUT[data]
+    out[:, -1] = ord("\n")
+    return out.tobytes().decode("ascii")
+
+
 def dump_pdf_bytes(pdf_path: str, out_txt: str | None = None, width: int = 16) -> str:
     """
     Hex-dump a PDF's raw bytes.
@@ -19,16 +60,23 @@ def dump_pdf_bytes(pdf_path: str, out_txt: str | None = None, width: int = 16) -
     Returns:
         The dump as a single string.
     """
+    parts = []
     with open(pdf_path, "rb") as f:
-        data = f.read()
-
-    lines = []
-    for off in range(0, len(data), width):
-        chunk = data[off:off+width]
-        hex_part = " ".join(f"{b:02X}" for b in chunk)
-        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        lines.append(f"{off:08X}  {hex_part:<{width*3}}  {ascii_part}")
-    dump = "\n".join(lines)
+        # map the file instead of reading it into memory; empty files can't be mapped
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                block = width * _BLOCK_LINES
+                for base in range(0, len(data), block):
+                    buf = data[base:base+block]
+                    full = len(buf) - len(buf) % width
+                    # the kernel writes 8 offset digits, so keep >4 GiB offsets on the slow path
+                    if full and base + len(buf) <= 0xFFFFFFFF:
+                        parts.append(_format_full_lines(buf, base, width))
+                    else:
+                        full = 0
+                    for i in range(full, len(buf), width):
+                        parts.append(_format_line(base + i, buf[i:i+width], width))
+    dump = "".join(parts)[:-1]  # no trailing newline
 
     if out_txt:
         with open(out_txt, "w", encoding="utf-8") as fh:
@@ -40,6 +88,8 @@ def dump_pdf_structure(pdf_path: str, out_txt: str | None = None, max_words: int
     """
     Dump the entire PDF structure (per page) to a string and optionally write to a .txt file.
     Shows: page size, extract_text(), words with boxes, chars with boxes/font/size, and object counts.
+    Pages are closed right after they are dumped, so memory is bounded by one page
+    (needs pdfplumber >= 0.11 for Page.close()).
 
     Args:
         pdf_path: path to a PDF
@@ -50,13 +100,6 @@ def dump_pdf_structure(pdf_path: str, out_txt: str | None = None, max_words: int
     Returns:
         The full dump as a single string.
     """
-    def _norm(s: str) -> str:
-        s = unicodedata.normalize("NFKC", s or "")
-        s = s.replace("\u00A0", " ")
-        s = s.replace("\r\n", "\n").replace("\r", "\n")
-        s = re.sub(r"-\n(?=\w)", "", s)  # de-hyphenate across line breaks
-        return s
-
     pdf_path = str(pdf_path)
     lines: list[str] = []
     with pdfplumber.open(pdf_path) as pdf:
@@ -65,13 +108,27 @@ def dump_pdf_structure(pdf_path: str, out_txt: str | None = None, max_words: int
             lines.append(f"\n===== PAGE {i}/{total_pages} =====")
             lines.append(f"size: {page.width:.2f} x {page.height:.2f} pt")
 
+            # One word clustering pass over the (cached) chars feeds both the
+            # page text and the word list; extract_text() and extract_words()
+            # would each run their own.
+            chars = page.chars or []
+            wordmap = _WORDS.extract_wordmap(chars)
+            words = [w for w, _ in wordmap.tuples]
+
             # 1) Full page text (what regexes usually see)
-            text = page.extract_text(x_tolerance=2, y_tolerance=2) or ""
+            text = ""
+            if chars:
+                text = wordmap.to_textmap(
+                    layout_bbox=page.bbox,
+                    layout_width=page.width,
+                    layout_height=page.height,
+                    y_tolerance=2,
+                    presorted=True,
+                ).as_string
             lines.append("\n-- extract_text() --")
-            lines.append(_norm(text))
+            lines.append(normalize_text(text))
 
             # 2) Words with bounding boxes
-            words = page.extract_words(x_tolerance=2, y_tolerance=2) or []
             lines.append(f"\n-- words (count={len(words)}) [x0,top,x1,bottom] text --")
             for idx, w in enumerate(words):
                 if max_words is not None and idx >= max_words:
@@ -80,7 +137,6 @@ def dump_pdf_structure(pdf_path: str, out_txt: str | None = None, max_words: int
                 lines.append(f"{w['x0']:.1f},{w['top']:.1f},{w['x1']:.1f},{w['bottom']:.1f}  {w['text']}")
 
             # 3) Characters with bounding boxes + font info
-            chars = page.chars or []
             lines.append(f"\n-- chars (count={len(chars)}) [x0,top,x1,bottom] 'ch' font size --")
             for idx, c in enumerate(chars):
                 if max_chars is not None and idx >= max_chars:
@@ -96,6 +152,9 @@ def dump_pdf_structure(pdf_path: str, out_txt: str | None = None, max_words: int
                 f"\n-- objects -- lines={len(page.lines)} rects={len(page.rects)} curves={len(page.curves)} images={len(page.images)}"
             )
 
+            # free the page's cached objects before the next one (pdfplumber >= 0.11)
+            page.close()
+
     dump = "\n".join(lines)
     if out_txt:
         with open(out_txt, "w", encoding="utf-8") as fh:
@@ -103,19 +162,27 @@ def dump_pdf_structure(pdf_path: str, out_txt: str | None = None, max_words: int
     return dump
 
 
-def scan_directory(in_dir: str, out_csv: str | None = None):
+def _dump_one(job: tuple[Path, str]) -> str:
+    """Worker for scan_directory: dump one PDF into its own text file."""
+    p, out_txt = job
+    dump_pdf_structure(p, out_txt, max_words=10000, max_chars=50000)
+    #dump_pdf_bytes(p, out_txt, width=16)
+    return p.name
+
+
+def scan_directory(in_dir: str, out_csv: str | None = None, max_workers: int | None = None):
     """
-    Scan all PDFs in a directory and return a DataFrame with the extracted fields.
-    Optionally write a CSV for inspection.
+    Dump the structure of all PDFs in a directory, one worker process per CPU.
+    Each PDF gets its own dump file (<stem>_HumanCheck.txt) so parallel workers
+    don't overwrite each other; files go to out_csv if given, else ~/Downloads.
     """
-    out_csv = os.path.join(os.path.expanduser("~"), "Downloads", "HumanCheck.txt")
-
-    out_cs = os.path.join(os.path.expanduser("~"), "Downloads", "HumanCheck.txt")
+    out_dir = out_csv or os.path.join(os.path.expanduser("~"), "Downloads")
+    os.makedirs(out_dir, exist_ok=True)
     in_dir = Path(in_dir)
-    for p in sorted(in_dir.glob("*.pdf")):
-        print(f"Processing {p.name}...")
-        dump_pdf_structure(p, out_csv, max_words=10000, max_chars=50000)
-        #dump_pdf_bytes(p, out_cs, width=16)
+    jobs = [(p, os.path.join(out_dir, f"{p.stem}_HumanCheck.txt")) for p in sorted(in_dir.glob("*.pdf"))]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for name in pool.map(_dump_one, jobs, chunksize=4):
+            print(f"Processed {name}")
 
 
 # --- CLI -------------------------------------------------------------------
@@ -124,7 +191,7 @@ if __name__ == "__main__":
     import argparse
     ap = argparse.ArgumentParser(description="Extract Handelsregister fields from PDFs.")
     ap.add_argument("--in", dest="in_dir", required=True, help="Folder with downloaded PDFs")
-    ap.add_argument("--out", dest="out_csv", default=None, help="Optional CSV path to save results")
+    ap.add_argument("--out", dest="out_csv", default=None, help="Optional folder for the dump files (default: ~/Downloads)")
     args = ap.parse_args()
     print(f"Scanning directory: {args.in_dir}")
     scan_directory(args.in_dir, args.out_csv)
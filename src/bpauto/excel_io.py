@@ -24,6 +24,13 @@ except ImportError:  # pragma: no cover - fallback für statische Analyse
     Workbook = object  # type: ignore[assignment]
     Worksheet = object  # type: ignore[assignment]
 
+try:  # pragma: no cover - optionale Abhängigkeit
+    import python_calamine  # noqa: F401
+
+    _READ_ENGINE: str | None = "calamine"  # Rust-Reader, deutlich schneller als openpyxl
+except ImportError:  # pragma: no cover - pandas-Standard (openpyxl)
+    _READ_ENGINE = None
+
 
 class RowData(TypedDict, total=False):
     """Representation einer gelesenen Tabellenzeile."""
@@ -195,22 +202,15 @@ def _combine_name_parts(parts: Iterable[str | None]) -> str | None:
     return max(fragments, key=len)
 
 
-def _read_cell(worksheet: Worksheet, column: str | None, row_index: int) -> str | None:
-    column = _normalise_column(column)
-    if not column:
-        return None
-    cell = worksheet[f"{column}{row_index}"]
-    return _cell_to_string(cell.value)
-
-
 def _find_last_row_with_name(worksheet: Worksheet, name_column: str, start_row: int) -> int:
     normalised_name = _normalise_column(name_column)
     if not normalised_name:
         raise ValueError("Name column must be provided")
 
     max_row = worksheet.max_row
+    column_idx = _column_letter_to_index(normalised_name) + 1
     for row_idx in range(max_row, start_row - 1, -1):
-        value = _read_cell(worksheet, normalised_name, row_idx)
+        value = _cell_to_string(worksheet.cell(row=row_idx, column=column_idx).value)
         if value is not None:
             return row_idx
     return start_row - 1
@@ -288,24 +288,47 @@ def iter_rows(
             LOGGER.info("Keine Datenzeilen in Blatt '%s' (%s) gefunden", sheet, excel_path)
             return
 
-        for row_idx in range(start, stop + 1):
-            name_value = _read_cell(worksheet, normalised_name_col, row_idx)
+        # Spaltenindizes einmal auflösen, Zeilen dann als Werte-Tupel lesen
+        name_idx = _column_letter_to_index(normalised_name_col)
+        extra_idx = [_column_letter_to_index(column) for column in additional_name_cols]
+        zip_idx, city_idx, country_idx, street_idx, house_number_idx = (
+            _column_letter_to_index(column) if column and _normalise_column(column) else None
+            for column in (zip_col, city_col, country_col, street_col, house_number_col)
+        )
+        max_col = 1 + max(
+            idx
+            for idx in (
+                name_idx,
+                *extra_idx,
+                zip_idx,
+                city_idx,
+                country_idx,
+                street_idx,
+                house_number_idx,
+            )
+            if idx is not None
+        )
+
+        def _value(values: tuple[object, ...], idx: int | None) -> str | None:
+            return None if idx is None else _cell_to_string(values[idx])
+
+        rows = worksheet.iter_rows(min_row=start, max_row=stop, max_col=max_col, values_only=True)
+        for row_idx, values in enumerate(rows, start):
+            name_value = _value(values, name_idx)
             if name_value is None:
                 continue
 
-            extra_parts = [
-                _read_cell(worksheet, column, row_idx) for column in additional_name_cols
-            ]
+            extra_parts = [_value(values, idx) for idx in extra_idx]
             combined_name = _combine_name_parts([name_value, *extra_parts])
 
             row_data: RowData = RowData(
                 index=row_idx,
                 name=combined_name or name_value,
-                zip=_read_cell(worksheet, zip_col, row_idx),
-                city=_read_cell(worksheet, city_col, row_idx),
-                country=_read_cell(worksheet, country_col, row_idx),
-                street=_read_cell(worksheet, street_col, row_idx),
-                house_number=_read_cell(worksheet, house_number_col, row_idx),
+                zip=_value(values, zip_idx),
+                city=_value(values, city_idx),
+                country=_value(values, country_idx),
+                street=_value(values, street_idx),
+                house_number=_value(values, house_number_idx),
             )
             yielded += 1
             yield row_data
@@ -431,18 +454,16 @@ def write_update_to_excel(
 ) -> bool:
     """Aktualisiert eine Excel-Zeile mit den gelieferten Informationen."""
 
-    df = pd.read_excel(path, sheet_name=sheet, header=None)
-    row_index = row - 1
-
-    sup_idx = _column_letter_to_index(sap_supplier_col) if sap_supplier_col else None
-    cus_idx = _column_letter_to_index(sap_customer_col) if sap_customer_col else None
-    sap_supplier = _normalise_sap(df.iat[row_index, sup_idx]) if sup_idx is not None else None
-    sap_customer = _normalise_sap(df.iat[row_index, cus_idx]) if cus_idx is not None else None
-    sap_new = _normalise_sap(update_info.get("sap_number"))
-
+    # SAP-Nummern aus der zwischengespeicherten Arbeitsmappe, nicht per read_excel pro Zeile
     workbook = _get_or_load_workbook(path)
     worksheet = _get_worksheet(workbook, sheet)
 
+    sup_col = _normalise_column(sap_supplier_col)
+    cus_col = _normalise_column(sap_customer_col)
+    sap_supplier = _normalise_sap(worksheet[f"{sup_col}{row}"].value) if sup_col else None
+    sap_customer = _normalise_sap(worksheet[f"{cus_col}{row}"].value) if cus_col else None
+    sap_new = _normalise_sap(update_info.get("sap_number"))
+
     if not sap_new or (sap_new != sap_supplier and sap_new != sap_customer):
         LOGGER.warning(
             "SAP-Mismatch in Zeile %s: neu=%s, Lieferant=%s, Kunde=%s",
@@ -490,6 +511,43 @@ def col_letter_to_idx(letter: str) -> int:
     return _column_letter_to_index(letter)
 
 
+def _iter_sheet_values(
+    path: str,
+    sheet: str | None,
+    start_row: int,
+    end_row: int | None,
+    max_col: int,
+) -> Iterator[tuple[object, ...]]:
+    """Liefert die Zeilen ``start_row``..``end_row`` als Werte-Tupel ab Spalte A.
+
+    Ohne python-calamine streamt openpyxl im ``read_only``-Modus Zeile für Zeile,
+    statt das Blatt erst in einen DataFrame zu laden.
+    """
+
+    if _READ_ENGINE is not None:
+        df_slice = pd.read_excel(
+            path,
+            sheet_name=sheet or 0,
+            header=None,
+            engine=_READ_ENGINE,
+            skiprows=start_row - 1,
+            nrows=None if end_row is None else end_row - start_row + 1,
+            usecols=lambda idx: idx < max_col,
+            dtype=object,  # keine Umwandlung ganzer Zahlen in float
+        )
+        yield from df_slice.itertuples(index=False, name=None)
+        return
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = _get_worksheet(workbook, sheet)
+        yield from worksheet.iter_rows(
+            min_row=start_row, max_row=end_row, max_col=max_col, values_only=True
+        )
+    finally:
+        workbook.close()
+
+
 def read_jobs_from_excel(
     path: str,
     sheet: str | None,
@@ -502,27 +560,48 @@ def read_jobs_from_excel(
     start: int | None,
     end: int | None,
 ) -> list[dict[str, str | None]]:
-    """Liest Unternehmensdaten aus einer Excel-Datei und gibt Jobs zurück."""
+    """Liest Unternehmensdaten aus einer Excel-Datei und gibt Jobs zurück.
 
-    df = pd.read_excel(path, sheet_name=sheet, header=None)
-    total_rows = len(df)
+    Es werden nur die Zeilen ``start``..``end`` bis zur letzten benötigten Spalte
+    gelesen; Zahlen bleiben ``int`` (``12038`` statt ``12038.0``).
+    """
 
     start_row = start if (start and start > 0) else 1
-    end_row = end if (end and end > 0) else total_rows
-
-    if start_row > total_rows or end_row < start_row:
+    end_row = end if (end and end > 0) else None
+    if end_row is not None and end_row < start_row:
         return []
 
-    df_slice = df.iloc[start_row - 1 : end_row]
+    # Spaltenindizes einmal auflösen (None = Spalte nicht angegeben)
+    name_idx, regno_idx, sap_supplier_idx, sap_customer_idx, postal_code_idx, country_idx = (
+        _column_letter_to_index(column) if column else None
+        for column in (
+            name_col,
+            regno_col,
+            sap_supplier_col,
+            sap_customer_col,
+            postal_code_col,
+            country_col,
+        )
+    )
+    max_col = 1 + max(
+        idx
+        for idx in (
+            name_idx,
+            regno_idx,
+            sap_supplier_idx,
+            sap_customer_idx,
+            postal_code_idx,
+            country_idx,
+        )
+        if idx is not None
+    )
 
-    def _safe_get(row: pd.Series, column: str | None) -> str | None:
-        if not column:
+    def _safe_get(values: tuple[object, ...], idx: int | None) -> str | None:
+        # Zeilen können kürzer sein, wenn das Blatt vor der Spalte endet
+        if idx is None or idx >= len(values):
             return None
-        idx = _column_letter_to_index(column)
-        if idx < 0 or idx >= len(row):
-            return None
-        value = row.iat[idx]
-        if pd.isna(value):
+        value = values[idx]
+        if value is None or pd.isna(value):
             return None
         if isinstance(value, str):
             cleaned = value.strip()
@@ -531,13 +610,14 @@ def read_jobs_from_excel(
         return cleaned or None
 
     jobs: list[dict[str, str | None]] = []
-    for _, series in df_slice.iterrows():
-        name = _safe_get(series, name_col)
-        register_no = _safe_get(series, regno_col)
-        sap_supplier = _safe_get(series, sap_supplier_col)
-        sap_customer = _safe_get(series, sap_customer_col)
-        postal_code = _safe_get(series, postal_code_col)
-        country = _safe_get(series, country_col)
+    blank_rows = 0
+    for values in _iter_sheet_values(path, sheet, start_row, end_row, max_col):
+        name = _safe_get(values, name_idx)
+        register_no = _safe_get(values, regno_idx)
+        sap_supplier = _safe_get(values, sap_supplier_idx)
+        sap_customer = _safe_get(values, sap_customer_idx)
+        postal_code = _safe_get(values, postal_code_idx)
+        country = _safe_get(values, country_idx)
 
         sap_raw = sap_supplier or sap_customer
         if sap_raw is not None and sap_raw.isdigit():
@@ -545,15 +625,21 @@ def read_jobs_from_excel(
         else:
             sap_value = sap_raw
 
-        jobs.append(
-            {
-                "name": name,
-                "register_no": register_no,
-                "sap": sap_value,
-                "postal_code": postal_code,
-                "country": country,
-            }
-        )
+        job: dict[str, str | None] = {
+            "name": name,
+            "register_no": register_no,
+            "sap": sap_value,
+            "postal_code": postal_code,
+            "country": country,
+        }
+        # Leerzeilen erst übernehmen, wenn danach noch Daten folgen: formatierte,
+        # aber leere Zeilen am Blattende (max_row) ergeben sonst Millionen Jobs
+        if not any(job.values()):
+            blank_rows += 1
+            continue
+        jobs.extend(dict.fromkeys(job) for _ in range(blank_rows))
+        blank_rows = 0
+        jobs.append(job)
 
     LOGGER.info("Aus Excel geladen: %s Jobs", len(jobs))
     return jobs
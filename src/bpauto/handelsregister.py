@@ -12,14 +12,23 @@ Note: Respects site behavior; do not exceed rate limits.
 
 import argparse
 import asyncio
+import json
+import logging
 import os
+import random
 import re
+import shutil
 import sys
 import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date
+from itertools import islice
+from typing import TextIO
 
+from playwright.async_api import Browser, BrowserContext, Locator, Page, async_playwright
 from playwright.async_api import TimeoutError as PwTimeoutError
-from playwright.async_api import async_playwright
 
 from . import excel_io, pdf_scanner
 from .utils.logging_setup import setup_logger
@@ -50,10 +59,59 @@ def _log_print(*args, sep: str = " ", end: str = "\n") -> None:
 print = _log_print  # type: ignore[assignment]
 
 
-page = None  # Global page object for async context
-counter = 0  # for timer logic
-reruns = 0  # for reruns logic
-debug = False
+def _debug_enabled() -> bool:
+    """True with --debug; guards debug-only work (message formatting, DOM dumps)."""
+    return LOGGER.isEnabledFor(logging.DEBUG)
+
+
+START_URL = "https://www.handelsregister.de/rp_web/welcome.xhtml"
+_ADVANCED_SEARCH_LINK = "#naviForm\\:erweiterteSucheLink"
+_KEYWORD_INPUT = "#form\\:schlagwoerter"
+# Result table body; "ergebnissForm" (double s) is the JSF form id the site uses
+_RESULTS_TBODY = "#ergebnissForm\\:selectedSuchErgebnisFormTable_data"
+_advanced_search_url: str | None = None  # learned by open_startpage on the first click-through
+_DOWNLOADS_DIR = os.path.join(os.path.expanduser("~"), "Downloads")
+_HUMAN_CHECK_PATH = os.path.join(_DOWNLOADS_DIR, "HumanCheck.txt")
+_DEFAULT_OUTDIR = os.path.join(_DOWNLOADS_DIR, "BP")
+
+_SEARCHES_PER_HOUR = 60  # site limit (VERY IMPORTANT)
+# start times of the last 60 searches (all workers); a search may start once the
+# oldest of them is an hour old
+_search_times: deque[float] = deque(maxlen=_SEARCHES_PER_HOUR)
+_search_lock = asyncio.Lock()  # one worker at a time takes / waits for a search slot
+# Excel batch mode: row writes wait while the cached workbook is saved in a thread
+_workbook_lock = asyncio.Lock()
+
+_pool_tasks: set[asyncio.Task] = set()  # keep refill tasks referenced until done
+
+# PDF parsing is pure CPU (and PDFium is not thread-safe) → worker processes
+_PDF_WORKERS = min(4, os.cpu_count() or 1)
+# PDFs that may still be saving/parsing while their slot already searches again
+_MAX_PENDING_SAVES = 3
+_MAX_SEARCH_ATTEMPTS = 5  # per perform_search call, with exponential backoff in between
+_MAX_DOWNLOAD_RETRIES = 3  # reruns per job when the AD download fails, then HumanCheck
+_SAVE_EVERY = 25  # finished Excel jobs between intermediate workbook saves
+_CHECKPOINT_SUFFIX = ".done.jsonl"  # next to the workbook: one line per finished job
+
+# Not needed for filling forms / reading the DOM; aborted for every page of a slot.
+# Stylesheets stay: PrimeFaces hides overlays via CSS and clicks check visibility.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "manifest"})
+_BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar", "matomo")
+_WARM_PAGE_MAX_AGE = 300  # seconds; older spare pages are re-navigated before use
+
+
+@dataclass
+class BrowserSlot:
+    """
+    One worker's own browser context, the page it currently searches on and warm
+    spare pages (already on the search form) handed out on reruns.
+    Reruns replace `page`, so functions take the slot rather than the page.
+    """
+
+    context: BrowserContext
+    page: Page
+    spares: asyncio.Queue = field(default_factory=asyncio.Queue)
+    reruns: int = 0  # reruns since this worker's last 10 minute pause
 
 # Map to existing CLI semantics
 SCHLAGWORT_OPTIONEN = {
@@ -61,11 +119,24 @@ SCHLAGWORT_OPTIONEN = {
     "min": 2,  # contain at least one keyword
     "exact": 3,  # exact company name
 }
+# Radio button per mode (rendered as input[name='form:schlagwortOptionen'][value='1'|'2'|'3'])
+_SCHLAGWORT_RADIOS = {
+    mode: f"input[name='form:schlagwortOptionen'][value='{value}']"
+    for mode, value in SCHLAGWORT_OPTIONEN.items()
+}
+
+
+# Compiled once at import; used for every search / download
+_RE_SPLIT_WORDS = re.compile(r"[ -]+")  # keyword → words (first five are searched)
+_RE_UNSAFE_FILENAME = re.compile(r'[\\/:*?"<>|]+')  # characters Windows rejects in names
+_UMLAUT_TABLE = str.maketrans({"Ö": "OE", "Ä": "AE", "Ü": "UE", "ß": "SS"})
 
 
 # TODO: Debug helper to print element value and outerHTML
 async def _debug_dump_element(page, selector: str, label: str, clip: int = 1500):
     """Print value + outerHTML of an element (trimmed), only for debug."""
+    if not _debug_enabled():
+        return
     try:
         el = page.locator(selector).first
         # Works for <input> and <textarea>
@@ -84,12 +155,14 @@ async def _debug_dump_element(page, selector: str, label: str, clip: int = 1500)
 async def _debug_dump_results(page, clip: int = 5000):
     """
     Dump outerHTML of the results area after search.
-    Tries ergebnisForm first, then its result table, then the grid.
+    Tries ergebnissForm first, then its result table, then the grid.
     """
+    if not _debug_enabled():
+        return
     selectors = [
-        "form#ergebnisForm",
-        "form[id^='ergebnisForm']",
-        "#ergebnisForm\\:selectedSuchErgebnisFormTable_data",
+        "form#ergebnissForm",
+        "form[id^='ergebnissForm']",
+        _RESULTS_TBODY,
         "[id$='selectedSuchErgebnisFormTable_data']",
         "table[role='grid']",
     ]
@@ -116,7 +189,18 @@ async def _debug_dump_results(page, clip: int = 5000):
 # TODO: No reach, errors
 
 
+async def _count_rerun(slot: BrowserSlot) -> None:
+    """Count a rerun of this worker; after more than 3 pause 10 minutes (rate limiting)."""
+    slot.reruns += 1
+    if slot.reruns > 3:
+        print("[warn] More than 3 reruns, sleeping for 10 minutes to avoid rate limiting...")
+        await asyncio.sleep(600)
+        slot.reruns = 0
+    print("[warn] Rerun")
+
+
 async def rerun_search(
+    slot: BrowserSlot,
     keyword: str,
     mode: str,
     register_number: str = None,
@@ -127,90 +211,202 @@ async def rerun_search(
     sap_number=None,
     outdir=None,
 ):
-    global page
-    global reruns
-    reruns += 1
-    if reruns > 3:
-        # sleep for 10 minutes if more than 3 reruns
-        print("[warn] More than 3 reruns, sleeping for 10 minutes to avoid rate limiting...")
-        time.sleep(600)
-        reruns = 0
-    print("[warn] Rerun")
-    page = await page.context.new_page()  # Reset page context
-    await open_startpage()
-    await perform_search(
+    await _count_rerun(slot)
+    await take_page(slot)  # fresh page, usually already on the search form
+    if not await perform_search(
+        slot,
         keyword,
         mode,
         register_number=register_number,
         postal_code=postal_code,
         postal_code_option=postal_code_option,
-    )
+    ):
+        return None
     if download:
-        return await download_ad_for_row(company_name, outdir, sap_number)
+        return await download_ad_for_row(slot, company_name, outdir, sap_number)
     return None
 
 
 # TODO: Perform search
 
 
-async def open_startpage():
-    # Landing page → ensure we land on welcome.xhtml
-    global page
-    global debug
-    await page.goto(
-        "https://www.handelsregister.de/rp_web/welcome.xhtml", wait_until="domcontentloaded"
-    )
-    if debug:
+async def open_startpage(page: Page):
+    """
+    Open the advanced search form (DOM only) so that the next perform_search can
+    fill it without another navigation. Once a click-through has revealed the
+    form's own URL it is loaded directly (one request instead of welcome page +
+    JSF postback); the full welcome.xhtml → 'Advanced search' flow is the fallback.
+    If that fails as well perform_search simply clicks again.
+    """
+    global _advanced_search_url
+    if _advanced_search_url:
+        try:
+            await page.goto(_advanced_search_url, wait_until="domcontentloaded")
+            if await page.is_visible(_KEYWORD_INPUT):
+                return
+        except PwTimeoutError:
+            pass
+        if _debug_enabled():
+            print("[debug] advanced search URL no longer opens the form, using the welcome page")
+        _advanced_search_url = None
+    await page.goto(START_URL, wait_until="domcontentloaded")
+    if _debug_enabled():
         print("[debug] opened welcome page:", page.url)
+    try:
+        await page.click(_ADVANCED_SEARCH_LINK, timeout=10000)
+        await page.wait_for_selector(_KEYWORD_INPUT, timeout=10000)
+    except PwTimeoutError:
+        if _debug_enabled():
+            print("[debug] advanced search not prefetched, perform_search will open it")
+        return
+    # a postback that stays on welcome.xhtml gives no usable deep link
+    if not page.url.startswith(START_URL):
+        _advanced_search_url = page.url
 
 
-async def perform_search(
+# TODO: Browser slots / page pool
+
+
+async def _warm_page(context: BrowserContext):
+    """New page that already shows the advanced search form, with its load timestamp."""
+    new_page = await context.new_page()
+    try:
+        await open_startpage(new_page)
+    except Exception as e:
+        if _debug_enabled():
+            print(f"[debug] warming page failed: {e}")
+    return new_page, time.monotonic()
+
+
+async def _refill_spares(slot: BrowserSlot) -> None:
+    try:
+        slot.spares.put_nowait(await _warm_page(slot.context))
+    except Exception as e:
+        if _debug_enabled():
+            print(f"[debug] could not refill spare pages: {e}")
+
+
+async def _block_static(route) -> None:
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in _BLOCKED_HOSTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def open_slot(browser: Browser, spares: int = 1) -> BrowserSlot:
+    """New isolated context with a page on the start page plus `spares` warm pages."""
+    # No HAR/video recording (off unless requested); JavaScript stays on (JSF forms).
+    # Default viewport kept: a narrow one could collapse the site's navigation menu.
+    context = await browser.new_context(
+        accept_downloads=True,
+        locale="en-GB",
+        service_workers="block",
+        reduced_motion="reduce",
+    )
+    await context.route("**/*", _block_static)
+    slot = BrowserSlot(context, await context.new_page())
+    warm = await asyncio.gather(
+        open_startpage(slot.page), *(_warm_page(context) for _ in range(spares))
+    )
+    for spare in warm[1:]:
+        slot.spares.put_nowait(spare)
+    return slot
+
+
+async def take_page(slot: BrowserSlot) -> None:
+    """
+    Swap the slot's page for a warm spare (cold page if none is left) and close
+    the old one. A new spare is opened in the background so the next rerun finds
+    a warm page again.
+    """
+    old = slot.page
+    if not slot.spares.empty():
+        slot.page, loaded_at = slot.spares.get_nowait()
+        task = asyncio.create_task(_refill_spares(slot))
+        _pool_tasks.add(task)
+        task.add_done_callback(_pool_tasks.discard)
+        stale = time.monotonic() - loaded_at > _WARM_PAGE_MAX_AGE
+        if stale or slot.page.url == "about:blank":
+            await open_startpage(slot.page)  # JSF view state may have expired meanwhile
+    else:
+        slot.page = await slot.context.new_page()
+        await open_startpage(slot.page)
+    try:
+        await old.close()
+    except Exception:
+        pass
+
+
+async def acquire_search_slot() -> float:
+    """
+    Rolling 60-searches-per-hour window shared by all workers: wait until the
+    oldest of the last 60 searches is an hour old, then record this search.
+    Returns the seconds waited. Waiting workers queue up on the lock in order.
+    """
+    async with _search_lock:
+        waited = 0.0
+        if len(_search_times) == _SEARCHES_PER_HOUR:
+            waited = 3600 - (time.monotonic() - _search_times[0])
+            if waited > 0:
+                print(f"[info] 60 searches within the last hour, waiting {waited:.0f} seconds...")
+                await asyncio.sleep(waited)
+        _search_times.append(time.monotonic())
+        return max(waited, 0.0)
+
+
+async def _submit_search(
+    slot: BrowserSlot,
     keyword: str,
     mode: str,
     register_number: str = None,
     postal_code: str = None,
     postal_code_option=False,
-):
+) -> bool:
     """
-    Click 'Advanced search', fill the form, submit.
+    One search attempt: click 'Advanced search', fill the form, submit and wait for
+    the results table. Takes one slot of the 60 searches per hour first.
+    Returns False if the site did not react as expected (→ retry on a fresh page).
     """
-    global page
-    global counter
-    global debug
-    # Click advanced search
+    waited = await acquire_search_slot()
+    if slot.page.is_closed():
+        await take_page(slot)
+    elif waited > _WARM_PAGE_MAX_AGE:
+        await open_startpage(slot.page)  # JSF session may have expired while waiting
+    page = slot.page
+    # Click advanced search (warm pages from open_startpage already show the form)
     try:
-        await page.click("#naviForm\\:erweiterteSucheLink", timeout=30000)
+        if not await page.is_visible(_KEYWORD_INPUT):
+            await page.click(_ADVANCED_SEARCH_LINK, timeout=30000)
     except PwTimeoutError:
         print(
             "[warn] Could not open Advanced search. Website not reachable or UI may have changed."
         )
-        await rerun_search(keyword, mode, register_number, postal_code, postal_code_option)
-        return
+        return False
 
     # Wait for the form to be present (use a field we know)
     try:
-        await page.wait_for_selector("#form\\:schlagwoerter", timeout=30000)
+        await page.wait_for_selector(_KEYWORD_INPUT, timeout=30000)
     except PwTimeoutError:
         print(
             "[warn] Advanced search form not found; Website not reachable or UI may have changed."
         )
-        await rerun_search(keyword, mode, register_number, postal_code, postal_code_option)
-        return
+        return False
 
     # Form fields (JSF IDs usually 'form:schlagwoerter' and 'form:schlagwortOptionen')
     # We'll try robust selectors by id and by name.
     # Keyword input:
     try:
-        words = [w for w in re.split(r"[ -]+", keyword) if w]
-        first_five = " ".join(words[:5])
-        keyword = first_five  # Limit to first 5 words for search
-        await page.fill("#form\\:schlagwoerter", keyword)
+        words = (w for w in _RE_SPLIT_WORDS.split(keyword) if w)
+        keyword = " ".join(islice(words, 5))  # Limit to first 5 words for search
+        await page.fill(_KEYWORD_INPUT, keyword)
     except Exception:
         print(
             "[warn] Could not fill 'schlagwoerter' by ID, Website not reachable or UI may have changed."
         )
-        await rerun_search(keyword, mode, register_number, postal_code, postal_code_option)
-        return
+        return False
 
     # Print outerHTML
     # if debug:
@@ -226,8 +422,7 @@ async def perform_search(
         print(
             "[warn] Could not fill 'registerNummer' by ID, Website not reachable or UI may have changed."
         )
-        await rerun_search(keyword, mode, register_number, postal_code, postal_code_option)
-        return
+        return False
 
         # Print outerHTML
         # if debug:
@@ -243,15 +438,10 @@ async def perform_search(
             print(
                 "[warn] Could not fill 'postleitzahl' by ID, Website not reachable or UI may have changed."
             )
-            await rerun_search(keyword, mode, register_number, postal_code, postal_code_option)
-            return
+            return False
 
-    # Radio/select for schlagwortOptionen:
-    so_value = SCHLAGWORT_OPTIONEN[mode]
-    # This field is rendered as radio buttons (values 1,2,3). Try robust selection:
-    # Common pattern: input[name='form:schlagwortOptionen'][value='1']
-    radio_selector = f"input[name='form:schlagwortOptionen'][value='{so_value}']"
-    await page.check(radio_selector)
+    # Radio/select for schlagwortOptionen (selector per mode built once at import)
+    await page.check(_SCHLAGWORT_RADIOS[mode])
 
     # Submit the form by clicking the search button (works even if only registerNummer is filled)
     try:
@@ -261,50 +451,98 @@ async def perform_search(
         print(
             "[warn] Could not find search button by ID; Website not reachable or UI may have changed."
         )
-        await rerun_search(keyword, mode, register_number, postal_code, postal_code_option)
-        return
+        return False
 
-    if debug:
+    if _debug_enabled():
         print("[debug] clicked search; waiting for results…")
 
-    counter += 1  # Successfully clicked on search -> counter +1
     # Wait for results table, check for specific section in HTML body
     try:
-        await page.locator("#ergebnissForm\\:selectedSuchErgebnisFormTable_data").first.wait_for(
-            timeout=30000
-        )
+        await page.locator(_RESULTS_TBODY).first.wait_for(timeout=30000)
     except PwTimeoutError:
         print("[warn] Results table not found; Website not reachable or UI may have changed.")
-        await rerun_search(keyword, mode, register_number, postal_code, postal_code_option)
-        return
+        return False
 
-    if debug:
-        # await _debug_dump_results(page)
+    # await _debug_dump_results(page)
+    if _debug_enabled():
         print("[debug] results page loaded!")
+    return True
 
 
-async def get_results():
+async def perform_search(
+    slot: BrowserSlot,
+    keyword: str,
+    mode: str,
+    register_number: str = None,
+    postal_code: str = None,
+    postal_code_option=False,
+) -> bool:
+    """
+    Search with the advanced search form; failed attempts are retried on a fresh
+    page after an exponential backoff (with jitter), at most _MAX_SEARCH_ATTEMPTS
+    times. Returns False if the search never got through.
+    """
+    for attempt in range(_MAX_SEARCH_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(min(60, 0.5 * 2**attempt) + random.random())
+            await _count_rerun(slot)
+            await take_page(slot)
+        if await _submit_search(
+            slot, keyword, mode, register_number, postal_code, postal_code_option
+        ):
+            return True
+    print(f"[error] Search for '{keyword}' failed {_MAX_SEARCH_ATTEMPTS} times")
+    return False
+
+
+_RESULT_ROWS = "table[role='grid'] tr[data-ri]"  # JSF data row index attribute
+
+# All address cell variants as one compound selector → one querySelector per row
+_RESULT_ADDRESS = (
+    ".address, .ergebnisAdresse, .result-address, [data-label*='Adresse'], td[data-label*='Ort']"
+)
+
+# Runs in the browser: cell texts (+ optional address cell) of every result row in one call
+_JS_RESULT_ROWS = """
+(rows, addrSel) => rows.map(tr => {
+    const addr = tr.querySelector(addrSel);
+    return {
+        tds: [...tr.querySelectorAll('td')].map(td => td.innerText.trim()),
+        addr: addr ? addr.innerText.trim() : null,
+    };
+})
+"""
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """One row of the results table, with the locator for its AD link."""
+
+    row_index: int
+    court: str
+    name: str
+    registered_office: str
+    status: str
+    address: str
+    row_locator: Locator
+
+
+async def get_results(slot: BrowserSlot) -> list[SearchResult]:
     """
     Scrape the visible rows of the results table (first page).
-    Returns list of dicts with minimal fields, and row locators for clicking AD per row.
+    Returns one SearchResult per row, with its locator for clicking the AD.
+    All rows are read with a single evaluate_all on the rows locator instead of one
+    round trip per cell; the same locator hands out the per-row locators.
     """
-    global debug
-    rows = page.locator("table[role='grid'] tr[data-ri]")  # JSF data row index attribute
-    count = await rows.count()
+    page = slot.page
+    rows = page.locator(_RESULT_ROWS)
+    scraped = await rows.evaluate_all(_JS_RESULT_ROWS, _RESULT_ADDRESS)
     results = []
 
-    for i in range(count):
-        row = rows.nth(i)
-
+    for i, row in enumerate(scraped):
+        texts = row["tds"]
         # Typical columns: [state, court, name/company, registered office, status, ...]
-        # The exact order can vary slightly; we’ll fetch visible cell texts and assign minimally.
-        cells = row.locator("td")
-        ccount = await cells.count()
-        texts = []
-        for j in range(ccount):
-            # inner_text keeps formatting; text_content is also fine.
-            t = (await cells.nth(j).inner_text()).strip()
-            texts.append(t)
+        # The exact order can vary slightly; we fetch visible cell texts and assign minimally.
 
         # Heuristic mapping (based on your mechanize parser)
         # 0: (ui panel filler)
@@ -319,14 +557,15 @@ async def get_results():
         status = texts[4] if len(texts) > 4 else ""
 
         results.append(
-            {
-                "row_index": i,
-                "court": court,
-                "name": name,
-                "registered_office": registered_office,
-                "status": status,
-                "row_locator": row,  # keep for AD click
-            }
+            SearchResult(
+                row_index=i,
+                court=court,
+                name=name,
+                registered_office=registered_office,
+                status=status,
+                address=row["addr"] or "",
+                row_locator=rows.nth(i),  # scopes the AD click to this row
+            )
         )
 
     return results
@@ -338,96 +577,366 @@ async def get_results():
 def sanitize_filename(name: str) -> str:
     # Windows-safe filename
     name = name.strip()
-    return re.sub(r'[\\/:*?"<>|]+', "_", name)
+    return _RE_UNSAFE_FILENAME.sub("_", name)
 
 
-def create_human_check_file():
-    """Create a HumanCheck text file in Downloads directory for searches with multiple results or none"""
-    downloads_path = os.path.join(os.path.expanduser("~"), "Downloads")
-    check_file = os.path.join(downloads_path, "HumanCheck.txt")
+def _date_stamp(day: date) -> str:
+    """dd-mm-yyyy for AD filenames"""
+    return day.strftime("%d-%m-%Y")
 
-    if os.path.exists(check_file):
-        return
 
+def create_human_check_file():
+    """Create a HumanCheck text file in Downloads directory for searches with multiple results or none"""
     try:
-        with open(check_file, "w") as f:
+        # "x" fails if the file exists, no separate exists() check needed
+        with open(_HUMAN_CHECK_PATH, "x") as f:
             f.write(f"Script execution started at: {date.today().strftime('%d-%m-%Y %H:%M:%S')}")
-        print(f"[info] Created human check file: {check_file}")
+        print(f"[info] Created human check file: {_HUMAN_CHECK_PATH}")
+    except FileExistsError:
+        return
     except Exception as e:
         print(f"[error] Failed to create human check file: {e}")
 
 
 def replace_umlauts(text):
-    """Replace German umlauts after uppercase conversion"""
-    replacements = {"Ö": "OE", "Ä": "AE", "Ü": "UE", "ß": "SS"}
-    for umlaut, replacement in replacements.items():
-        text = text.replace(umlaut, replacement)
-    return text
+    """Replace German umlauts after uppercase conversion (one pass via str.translate)"""
+    return text.translate(_UMLAUT_TABLE)
 
 
-async def download_ad_for_row(company_name, outdir, sap_number=None, row_locator=None):
-    """
-    Waits for the single search result, clicks the AD link, and saves the PDF as
-    '<Company>_dd.mm.yyyy.pdf'. Returns the saved path or None on failure.
-    """
-    # for now only one row is expected,
-    # TODO: if more than one row is found, iterate over them, use row_locator
-    # Uppercase and replace umlauts in company name
-    global page
-    global debug
+_AD_LINK = "a[onclick*='Global.Dokumentart.AD']"
+
+
+async def _click_ad_link(slot: BrowserSlot, company_name, row_locator=None):
+    """Click the AD link (of `row_locator` if given) and return the started download or None."""
+    page = slot.page
+    # Most specific & stable selector for AD (per your HTML)
+    # Trigger and capture the download
     try:
-        # Check if the outdir exists, if not create it
-        os.makedirs(outdir, exist_ok=True)
+        if row_locator is not None:
+            ad_link = row_locator.locator(_AD_LINK)
+        else:
+            ad_link = page.locator(f"{_RESULTS_TBODY} {_AD_LINK}")
+        async with page.expect_download(timeout=40000) as dl_info:
+            await ad_link.click()
+        download = await dl_info.value
+        if _debug_enabled():
+            print(f"[debug] Download started for '{company_name}': {download.suggested_filename}")
+        return download
+    except Exception:
+        # with open(_HUMAN_CHECK_PATH, "a") as f:
+        #    f.write(f"\n\n[warn] Failed to click AD link for '{company_name}'; download may not have started. (SAP={sap_number or 'None'})")
+        print(f"[warn] Failed to click AD link for '{company_name}'; download may not have started.")
+        return None
 
-        # Most specific & stable selector for AD (per your HTML)
-        # Trigger and capture the download
-        try:
-            ad_link = page.locator(
-                "#ergebnissForm\\:selectedSuchErgebnisFormTable_data a[onclick*='Global.Dokumentart.AD']"
-            )
-            async with page.expect_download(timeout=40000) as dl_info:
-                await ad_link.click()
-            download = await dl_info.value
-            if debug:
-                print(
-                    f"[debug] Download started for '{company_name}': {download.suggested_filename}"
-                )
-        except Exception:
-            # check_file = os.path.join(os.path.expanduser("~"), "Downloads", "HumanCheck.txt")
-            # with open(check_file, "a") as f:
-            #    f.write(f"\n\n[warn] Failed to click AD link for '{company_name}'; download may not have started. (SAP={sap_number or 'None'})")
-            print(
-                f"[warn] Failed to click AD link for '{company_name}'; download may not have started."
-            )
-            return None
 
+async def _save_ad(download, company_name, outdir, sap_number=None):
+    """Save a started AD download as '<SAP>_<Company>_dd-mm-yyyy.pdf'; saved path or None."""
+    try:
         # sap_company_dd.mm.yyyy filename
-        date_str = date.today().strftime("%d-%m-%Y")
+        date_str = _date_stamp(date.today())
         prefix = (sanitize_filename(sap_number) + "_") if sap_number else ""
         fname = f"{prefix}{sanitize_filename(company_name)}_{date_str}.pdf"
         save_path = os.path.join(outdir, fname)
 
-        await download.save_as(save_path)
-        # Verify the file exists and has size > 0 (not corrupted)
-        if os.path.exists(save_path) and os.path.getsize(save_path) > 0:
-            if debug:
+        try:
+            # The finished file already sits in Playwright's temp folder: moving it is
+            # a rename on the same drive instead of save_as writing it a second time
+            await asyncio.to_thread(shutil.move, await download.path(), save_path)
+        except Exception:
+            await download.save_as(save_path)  # e.g. remote browser without local path
+        # Verify the file exists and has size > 0 (not corrupted); one stat call,
+        # a missing file raises FileNotFoundError (→ None below)
+        if os.stat(save_path).st_size > 0:
+            if _debug_enabled():
                 print(f"[debug] Saved AD PDF: {save_path}")
             return save_path
-
     except Exception as e:
-        if debug:
-            print(f"[warn] Failed to download AD for '{company_name}': {e}")
+        if _debug_enabled():
+            print(f"[debug] Failed to download AD for '{company_name}': {e}")
+    return None
+
+
+async def download_ad_for_row(
+    slot: BrowserSlot, company_name, outdir, sap_number=None, row_locator=None
+):
+    """
+    Waits for the single search result, clicks the AD link, and saves the PDF as
+    '<Company>_dd.mm.yyyy.pdf' into `outdir` (created by main_async).
+    Returns the saved path or None on failure.
+    """
+    # row_locator (from get_results) scopes the AD link to its row; without it
+    # the table-wide selector is used (single result, e.g. after a rerun)
+    download = await _click_ad_link(slot, company_name, row_locator)
+    if download is None:
         return None
+    return await _save_ad(download, company_name, outdir, sap_number)
 
 
 # TODO: Main
 
 
+async def extract_pdf(pdf_pool: Executor, path) -> dict:
+    """
+    pdf_scanner.extract_from_pdf in the run's PDF process pool, so the event loop
+    keeps serving the other workers while a PDF is parsed.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pdf_pool, pdf_scanner.extract_from_pdf, path)
+
+
+async def process_job(
+    idle: asyncio.Queue,
+    i: int,
+    job: dict,
+    args,
+    total: int,
+    human_check: TextIO,
+    pdf_pool: Executor,
+) -> bool | None:
+    """
+    Excel batch mode, one job (company, already checked by searchable_jobs): search
+    it, download the AD PDF and write the extracted fields back into the (cached)
+    Excel workbook. Several jobs run concurrently; a job borrows a browser slot from
+    `idle` only for search and AD click, saving + parsing the PDF runs while the slot
+    already serves the next job. `human_check` is the HumanCheck.txt handle opened
+    once per run, `pdf_pool` the PDF process pool of main_async.
+    Returns True if the row was updated, False if it was marked as error and None
+    if nothing was written (no --download-ad).
+    """
+    kw = job["name"]  # Company name to search for
+    reg = (
+        str(job["register_no"]) if job["register_no"] is not None else ""
+    )  # Register number (if available), normalized if it was in float
+    sap = job["sap"]  # SAP number (if available)
+    postal_code = job["postal_code"]  # Postal code (if available)
+    row = i + args.start - 1  # Excel row of this job
+
+    if _debug_enabled():
+        print(f"[debug] ({i}/{total}) {sap or 'NoSAP'} | {kw} | reg={reg or 'None'}")
+
+    # Refresh the start page for each job (avoids leftover form state) TODO: check if this is needed
+    # await open_startpage(page, debug=debug)
+
+    slot = await idle.get()  # FIFO waiters → jobs start in Excel order
+    try:
+        # Perform the advanced search with the name + optional register number
+        if not await perform_search(
+            slot,
+            kw,
+            args.schlagwortOptionen,
+            register_number=reg,
+            postal_code=postal_code,
+            postal_code_option=args.postal,
+        ):
+            human_check.write(f"\n[warn] search failed for '{kw}' (SAP={sap or 'None'}) in row {row}")
+            human_check.flush()
+            async with _workbook_lock:
+                excel_io.write_to_excel_error(
+                    path=args.excel,
+                    sheet=args.sheet,
+                    row=row,
+                    changes_check_col=args.changes_check_col,
+                    error_col=args.name1_col,
+                    error_msg="search failed",
+                )
+            return False
+        if _debug_enabled():
+            print(f"[debug] {kw} | reg={reg or 'None'}")
+
+        # Retrieve the search results (list of rows)
+        results = await get_results(slot)
+
+        # If we don't have exactly one match, log it to HumanCheck.txt and skip
+        if len(results) != 1:
+            human_check.write(
+                f"\n[info] found {len(results)} result row(s) for '{kw}' (SAP={sap or 'None'})"
+            )
+            human_check.flush()
+            print(f"[warn] {kw}: expected 1 result, got {len(results)} → logged to HumanCheck.txt")
+            async with _workbook_lock:
+                excel_io.write_to_excel_error(
+                    path=args.excel,
+                    sheet=args.sheet,
+                    row=row,  # Adjust for 0-based index
+                    changes_check_col=args.changes_check_col,
+                    error_col=args.name1_col,
+                    error_msg=f"{len(results)}",
+                )
+            print(f"[warn] Failed '{kw}' (SAP={sap or 'None'}); marked row {row} in Excel as error.")
+            return False  # Skip to next company
+
+        # If PDF download is enabled, download the AD (Current hard copy printout)
+        r = results[0]  # The single matching result TODO: Multiple if needed
+        company_name = replace_umlauts(r.name.upper())  # Uppercase and replace umlauts
+        if not args.download_ad:
+            return None
+
+        # AD link looked up within the result row, not across the whole table
+        download = await _click_ad_link(slot, company_name, r.row_locator)
+    finally:
+        idle.put_nowait(slot)
+
+    # The slot already runs the next search while this PDF is written to disk
+    path = await _save_ad(download, company_name, args.outdir, sap) if download else None
+    for attempt in range(_MAX_DOWNLOAD_RETRIES):
+        if path is not None:
+            break
+        # back off; every rerun costs one of the 60 searches per hour
+        await asyncio.sleep(min(2**attempt, 60))
+        slot = await idle.get()
+        try:
+            path = await rerun_search(
+                slot,
+                kw,
+                args.schlagwortOptionen,
+                register_number=reg,
+                postal_code=postal_code,
+                postal_code_option=args.postal,
+                download=True,
+                company_name=company_name,
+                sap_number=sap,
+                outdir=args.outdir,
+            )
+        finally:
+            idle.put_nowait(slot)
+    if path is None:
+        human_check.write(
+            f"\n[warn] AD download failed {_MAX_DOWNLOAD_RETRIES + 1} times for '{company_name}' (SAP={sap or 'None'}) in row {row}"
+        )
+        human_check.flush()
+        print(f"[warn] Giving up on the AD of '{company_name}' (SAP={sap or 'None'}) → logged to HumanCheck.txt")
+        async with _workbook_lock:
+            excel_io.write_to_excel_error(
+                path=args.excel,
+                sheet=args.sheet,
+                row=row,
+                changes_check_col=args.changes_check_col,
+                error_col=args.name1_col,
+                error_msg="AD download failed",
+            )
+        return False
+
+    update_info = (
+        await extract_pdf(pdf_pool, path)
+        | {"company_name": company_name, "sap_number": sap, "download_path": path}
+    )  # Extract fields from the downloaded PDF into a dict, override company_name with umlauts replaced
+    if update_info["register_type"] == "unexpected Format":
+        human_check.write(
+            f"[warn] Error, unexpected PDF Format '{company_name}' (SAP={sap or 'None'}) in row {row}"
+        )
+        human_check.flush()
+        print(f"[warn] Error, unexpected PDF Format '{company_name}' (SAP={sap or 'None'})")
+        async with _workbook_lock:
+            excel_io.write_to_excel_error(
+                path=args.excel,
+                sheet=args.sheet,
+                row=row,  # Adjust for 0-based index
+                changes_check_col=args.changes_check_col,
+                error_col=args.name1_col,
+                error_msg="unexpected PDF Format",
+                pdf_path=path,  # Save the path of PDF in excel
+                pdf_path_col=args.doc_path_col,
+            )
+        return False
+    # excel_io appends SAP mismatches to HumanCheck.txt itself: flush ours first
+    human_check.flush()
+    async with _workbook_lock:
+        excel_io.write_update_to_excel(
+            path=args.excel,
+            sheet=args.sheet,
+            row=row,  # Adjust for 0-based index
+            update_info=update_info,  # All info to update
+            name_col=args.name1_col,
+            regno_col=args.regno_col,
+            sap_supplier_col=args.sap_supplier_col,
+            sap_customer_col=args.sap_customer_col,
+            name2_col=args.name2_col,
+            name3_col=args.name3_col,
+            street_col=args.street_col,
+            house_number_col=args.house_number_col,
+            city_col=args.city_col,
+            postal_code_col=args.postal_code_col,
+            doc_path_col=args.doc_path_col,
+            changes_check_col=args.changes_check_col,
+            date_check_col=args.date_check_col,
+            register_type_col=args.register_type_col,
+            check_file=_HUMAN_CHECK_PATH,
+        )
+    print(f"[info] Updated Excel row {row} for '{company_name}' (SAP={sap or 'None'})")
+    return True
+
+
+def searchable_jobs(
+    jobs: list[dict], done: set[str] = frozenset(), start: int = 1
+) -> list[tuple[int, dict]]:
+    """
+    Keep the jobs that can be searched, as (job number, job) pairs; the number
+    (1-based position in `jobs`) maps back to the Excel row. Skipped jobs are
+    logged once, before any browser is started; jobs whose key is in `done`
+    (checkpoint of earlier runs) are only counted.
+    """
+    pending = []
+    resumed = 0
+    for i, job in enumerate(jobs, 1):
+        # TODO: Other countries
+        if job_key(i + start - 1, job) in done:
+            resumed += 1
+        elif job["country"] != "DE":
+            print(f"[warn] Skipping job {i}: country is not DE (got '{job['country']}').")
+        elif job["name"] is None:
+            print(f"[warn] Skipping job {i}: no company name provided.")
+        else:
+            pending.append((i, job))
+    if resumed:
+        print(f"[info] {resumed} jobs already done in an earlier run, not searched again")
+    if len(pending) < len(jobs):
+        print(f"[info] {len(jobs) - len(pending)} of {len(jobs)} jobs skipped, {len(pending)} to search")
+    return pending
+
+
+def job_key(row: int, job: dict) -> str:
+    """
+    Key of a job in the checkpoint file: Excel row plus SAP number, else name|register
+    number. The row keeps duplicate companies apart; moved rows are searched again.
+    """
+    ident = job["sap"] or f"{job['name']}|{job['register_no'] or ''}"
+    return f"{row}:{ident}"
+
+
+def checkpoint_path(excel: str, sheet: str | None) -> str:
+    """
+    Checkpoint file of one workbook sheet, next to the workbook
+    (`<excel>.<sheet>.done.jsonl`), so runs on other workbooks or sheets never share it.
+    """
+    name = f"{excel}.{sanitize_filename(sheet)}" if sheet else excel
+    return os.path.abspath(name + _CHECKPOINT_SUFFIX)
+
+
+def load_checkpoint(path: str, skip_failed: bool = False) -> set[str]:
+    """
+    Keys of the jobs finished in earlier runs (the last entry of a key counts).
+    Jobs marked as error are searched again unless `skip_failed` is set.
+    """
+    status = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # empty or cut off by a crash
+                status[entry["key"]] = entry["status"]
+    except FileNotFoundError:
+        pass
+    return {key for key, state in status.items() if state == "ok" or skip_failed}
+
+
 async def main_async(args):
     """
     Main asynchronous entry point for the Handelsregister script.
     Depending on CLI args, runs either:
-      - Excel batch mode: read multiple company names/register numbers from Excel
+      - Excel batch mode: read multiple company names/register numbers from Excel,
+        processed by --concurrency workers (one browser context each)
       - Single-shot mode: run for a single provided search term
 
     Handles:
@@ -436,186 +945,208 @@ async def main_async(args):
       - Downloading 'AD' PDF documents if requested
       - Logging cases where results are ambiguous
     """
-    global page
-    global counter
-    global debug
-
-    debug = args.debug
-    # Ensure output directory exists
-    if not os.path.exists(args.outdir):
-        default_path = os.path.join(os.path.expanduser("~"), "Downloads", "BP")
+    if args.debug:
+        _BASE_LOGGER.setLevel(logging.DEBUG)  # "[debug]" prints go to LOGGER.debug
+    # Ensure output directory exists (the download helpers rely on it)
+    if not os.path.isdir(args.outdir):
         print(f"[warn] Path not found: {args.outdir}")
-        print(f"[info] Creating default directory: {default_path}")
-        os.makedirs(default_path, exist_ok=True)
-        args.outdir = default_path
-    else:
-        os.makedirs(args.outdir, exist_ok=True)
+        print(f"[info] Creating default directory: {_DEFAULT_OUTDIR}")
+        os.makedirs(_DEFAULT_OUTDIR, exist_ok=True)
+        args.outdir = _DEFAULT_OUTDIR
+
+    if args.excel:
+        # Read company/job data from Excel using helper function
+        jobs = excel_io.read_jobs_from_excel(
+            path=args.excel,
+            sheet=args.sheet,
+            name_col=args.name_col,
+            regno_col=args.regno_col,
+            sap_supplier_col=args.sap_supplier_col,
+            sap_customer_col=args.sap_customer_col,
+            postal_code_col=args.postal_code_check_col,
+            country_col=args.country_col,
+            start=args.start,
+            end=args.end,
+        )
+        print(
+            f"[info] loaded {len(jobs)} jobs from Excel (rows {args.start or 3}..{args.end or 'last'})"
+        )
+        checkpoint = checkpoint_path(args.excel, args.sheet)
+        done = load_checkpoint(checkpoint, args.skip_failed)
+        if done:
+            print(f"[info] resuming from {checkpoint}; delete it to search all rows again")
+        pending = searchable_jobs(jobs, done, args.start)
+        if not pending:
+            print("[info] nothing to search.")
+            return
+
+    # One pool for all PDF parses of the run; the workers start (spawn + imports)
+    # while the browser launches instead of delaying the first parse
+    pdf_pool = ProcessPoolExecutor(
+        max_workers=_PDF_WORKERS, initializer=setup_logger, initargs=(_BASE_LOGGER.level,)
+    )
+    loop = asyncio.get_running_loop()
+    prewarm = asyncio.gather(
+        *(loop.run_in_executor(pdf_pool, os.getpid) for _ in range(_PDF_WORKERS))
+    )
 
     async with async_playwright() as p:
-        # Headless Chromium; accept downloads in the context
+        # Headless Chromium; every worker gets its own context that accepts downloads
         browser = await p.chromium.launch(headless=not args.headful)
-        context = await browser.new_context(accept_downloads=True, locale="en-GB")
-        page = await context.new_page()
 
-        if debug:
+        if _debug_enabled():
             print("[debug] Browser launched, opening start page...")
-        await open_startpage()
-
-        # TODO: Excel batch mode
-        if args.excel:
-            # Read company/job data from Excel using helper function
-            jobs = excel_io.read_jobs_from_excel(
-                path=args.excel,
-                sheet=args.sheet,
-                name_col=args.name_col,
-                regno_col=args.regno_col,
-                sap_supplier_col=args.sap_supplier_col,
-                sap_customer_col=args.sap_customer_col,
-                postal_code_col=args.postal_code_check_col,
-                country_col=args.country_col,
-                start=args.start,
-                end=args.end,
-            )
-
-            print(
-                f"[info] loaded {len(jobs)} jobs from Excel (rows {args.start or 3}..{args.end or 'last'})"
-            )
-
-            start_time = (
-                time.time()
-            )  # 1 hour timer to not go over the 60 search limitation (VERY IMPORTANT)
-            # Iterate through each job (company) from the Excel list
-            for i, job in enumerate(jobs, 1):
-                # TODO: Other countries
-                if job["country"] != "DE":
-                    print(f"[warn] Skipping job {i}: country is not DE (got '{job['country']}').")
-                    continue
-
-                # Timer logic: every 60 jobs, wait for the remaining time to complete the hour
-                if counter >= 60:
-                    elapsed_time = time.time() - start_time
-                    hour_in_seconds = 3600
-
-                    # If less than an hour has passed, wait for remaining time
-                    if elapsed_time < hour_in_seconds:
-                        wait_time = hour_in_seconds - elapsed_time
-                        print(f"[info] Waiting {wait_time:.0f} seconds to complete the hour...")
-                        await page.wait_for_timeout(wait_time * 1000)  # convert to milliseconds
-
-                    # Reset the timer
-                    start_time = time.time()
-                    print("[info] Hour timer reset")
-                    page = await context.new_page()  # Reset page context
-                    await open_startpage()
-
-                if job["name"] is None:
-                    print(f"[warn] Skipping job {i}: no company name provided.")
-
-                    continue
-
-                kw = job["name"]  # Company name to search for
-                reg = (
-                    str(job["register_no"]) if job["register_no"] is not None else ""
-                )  # Register number (if available), normalized if it was in float
-                sap = job["sap"]  # SAP number (if available)
-                postal_code = job["postal_code"]  # Postal code (if available)
-
-                if debug:
-                    print("")
-                    print(
-                        f"[debug] ({i}/{len(jobs)}) {sap or 'NoSAP'} | {kw} | reg={reg or 'None'}"
-                    )
-
-                # Refresh the start page for each job (avoids leftover form state) TODO: check if this is needed
-                # await open_startpage(page, debug=debug)
+        slot = await open_slot(browser)
+        slots = [slot]
 
-                # Perform the advanced search with the name + optional register number
-                await perform_search(
-                    kw,
-                    args.schlagwortOptionen,
-                    register_number=reg,
-                    postal_code=postal_code,
-                    postal_code_option=args.postal,
-                )
-                print(f"[debug] {kw} | reg={reg or 'None'}")
-
-                # Retrieve the search results (list of rows)
-                results = await get_results()
-
-                # If we don't have exactly one match, log it to HumanCheck.txt and skip
-                check_file = os.path.join(os.path.expanduser("~"), "Downloads", "HumanCheck.txt")
-                f = open(check_file, "a")
+        try:
+            await prewarm
+            # TODO: Excel batch mode
+            if args.excel:
+                workers = max(1, min(args.concurrency, len(pending)))
+                slots += await asyncio.gather(*(open_slot(browser) for _ in range(workers - 1)))
+                idle: asyncio.Queue = asyncio.Queue()
+                for s in slots:
+                    idle.put_nowait(s)
+
+                # jobs whose PDF is still being saved/parsed count as well → caps disk load
+                in_flight = asyncio.Semaphore(workers + _MAX_PENDING_SAVES)
+
+                finished: list[str] = []  # checkpoint lines of jobs since the last save
+
+                async def save_progress() -> bool:
+                    # jobs go into the checkpoint only once the workbook with their row
+                    # is saved, so a resumed run never skips a row that was lost
+                    async with _workbook_lock:
+                        if not finished:
+                            return True  # nothing written since the last save
+                        try:
+                            # a large workbook takes seconds to save: keep the loop (and
+                            # with it every browser slot) running meanwhile
+                            await asyncio.to_thread(excel_io.save, args.excel)
+                        except OSError as e:  # e.g. workbook open in Excel (Windows locks it)
+                            print(f"[warn] Could not save {args.excel} ({e}); retrying later.")
+                            return False
+                        done_file.writelines(finished)
+                        done_file.flush()
+                        finished.clear()
+                        return True
+
+                async def run(i, job, human_check):
+                    async with in_flight:
+                        try:
+                            updated = await process_job(
+                                idle, i, job, args, len(jobs), human_check, pdf_pool
+                            )
+                        except Exception as e:
+                            # one broken job must not end the batch; it is retried next run
+                            LOGGER.exception("Job %s (%s) failed: %s", i, job["name"], e)
+                            updated = False
+                    if updated is None:
+                        return  # row left untouched (no --download-ad): nothing to resume
+                    row = i + args.start - 1
+                    entry = {
+                        "key": job_key(row, job),
+                        "row": row,
+                        "status": "ok" if updated else "fail",
+                    }
+                    finished.append(json.dumps(entry, ensure_ascii=False) + "\n")
+                    if len(finished) >= _SAVE_EVERY:
+                        # a run takes hours (60 searches/hour): keep the progress on disk
+                        await save_progress()
+
+                # Iterate through each job (company) from the Excel list
+                with (
+                    open(_HUMAN_CHECK_PATH, "a") as human_check,
+                    open(checkpoint, "a", encoding="utf-8") as done_file,
+                ):
+                    try:
+                        await asyncio.gather(
+                            *(run(i, job, human_check) for i, job in pending)
+                        )
+                    finally:
+                        if not await save_progress():
+                            print(
+                                f"[error] Last {len(finished)} job(s) not saved to {args.excel}; "
+                                "the next run searches them again."
+                            )
+
+            # TODO: Single-shot mode
+            else:
+                if args.sap_number == "-1":
+                    print("In single-shot mode you must provide --sap_number.")
+                    return
+                if not args.schlagwoerter:
+                    print("In single-shot mode you must provide --schlagwoerter.")
+                    return
+                if args.row_number == "-1":
+                    print("In single-shot mode you must provide --row_number.")
+                    return
+                if not await perform_search(
+                    slot, args.schlagwoerter, args.schlagwortOptionen, register_number=args.register_number
+                ):
+                    return
+                results = await get_results(slot)
                 if len(results) != 1:
-                    f.write(
-                        f"\n[info] found {len(results)} result row(s) for '{kw}' (SAP={sap or 'None'})"
-                    )
-                    print(
-                        f"[warn] {kw}: expected 1 result, got {len(results)} → logged to HumanCheck.txt"
-                    )
-                    excel_io.write_to_excel_error(
-                        path=args.excel,
-                        sheet=args.sheet,
-                        row=i + args.start - 1,  # Adjust for 0-based index
-                        changes_check_col=args.changes_check_col,
-                        error_col=args.name1_col,
-                        error_msg=f"{len(results)}",
-                    )
+                    # Write to HumanCheck.txt in Downloads
+                    with open(_HUMAN_CHECK_PATH, "a") as f:
+                        f.write(
+                            f"\n\n[info] found {len(results)} result row(s) for '{args.schlagwoerter}'"
+                        )
+                    #    for r in results:
+                    #        f.write(f"\nname: {r.name}")
+                    #        f.write(f"\ncourt: {r.court}")
+                    #        f.write(f"\nstate/office: {r.registered_office}")
+                    #        f.write(f"\nstatus: {r.status}")
+                    #        f.write("\n")
+
                     print(
-                        f"[warn] Failed '{kw}' (SAP={sap or 'None'}); marked row {i + args.start - 1} in Excel as error."
+                        "[warn] Found multiple results or none; check HumanCheck.txt in Downloads for details."
                     )
-                    continue  # Skip to next company
+                    return
+                # check if only one result is found, if more TODO: interation already exists
 
-                # If PDF download is enabled, download the AD (Current hard copy printout)
-                r = results[0]  # The single matching result TODO: Multiple if needed
-                company_name = replace_umlauts(r["name"].upper())  # Uppercase and replace umlauts
-                if args.download_ad:
+                path = None  # Initialize path to None
+                if args.download_ad and len(results) == 1:
+                    r = results[0]
                     path = await download_ad_for_row(
-                        company_name=company_name,
+                        slot,
+                        company_name=r.name or "company",
                         outdir=args.outdir,
-                        sap_number=sap,  # Prefix SAP number to the filename if available
-                        row_locator=r["row_locator"],  # currently not used
+                        sap_number=args.sap_number,  # No SAP number in this case TODO
+                        row_locator=r.row_locator,
                     )
-                    while path is None:
-                        path = await rerun_search(
-                            kw,
-                            args.schlagwortOptionen,
-                            register_number=reg,
-                            postal_code=postal_code,
-                            postal_code_option=args.postal,
-                            download=True,
-                            company_name=company_name,
-                            sap_number=sap,
-                            outdir=args.outdir,
-                        )
 
+                if path is not None:
                     update_info = (
-                        pdf_scanner.extract_from_pdf(path)
-                        | {"company_name": company_name, "sap_number": sap, "download_path": path}
+                        await extract_pdf(pdf_pool, path)
+                        | {
+                            "company_name": results[0].name,
+                            "sap_number": args.sap_number,
+                            "download_path": path,
+                        }
                     )  # Extract fields from the downloaded PDF into a dict, override company_name with umlauts replaced
                     if update_info["register_type"] == "unexpected Format":
-                        f.write(
-                            f"[warn] Error, unexpected PDF Format '{company_name}' (SAP={sap or 'None'}) in row {i + args.start - 1}"
-                        )
                         print(
-                            f"[warn] Error, unexpected PDF Format '{company_name}' (SAP={sap or 'None'})"
+                            f"[warn] Error, unexpected PDF Format '{results[0].name}' (SAP={args.sap_number or 'None'})"
                         )
                         excel_io.write_to_excel_error(
                             path=args.excel,
                             sheet=args.sheet,
-                            row=i + args.start - 1,  # Adjust for 0-based index
+                            row=args.row_number,
                             changes_check_col=args.changes_check_col,
                             error_col=args.name1_col,
                             error_msg="unexpected PDF Format",
                             pdf_path=path,  # Save the path of PDF in excel
                             pdf_path_col=args.doc_path_col,
                         )
-                        continue
+                        return
                     excel_io.write_update_to_excel(
                         path=args.excel,
                         sheet=args.sheet,
-                        row=i + args.start - 1,  # Adjust for 0-based index
+                        row=args.row_number,
                         update_info=update_info,  # All info to update
-                        name_col=args.name1_col,
+                        name_col=args.name1_col,  # Update column
                         regno_col=args.regno_col,
                         sap_supplier_col=args.sap_supplier_col,
                         sap_customer_col=args.sap_customer_col,
@@ -629,114 +1160,19 @@ async def main_async(args):
                         changes_check_col=args.changes_check_col,
                         date_check_col=args.date_check_col,
                         register_type_col=args.register_type_col,
-                        check_file=os.path.join(
-                            os.path.expanduser("~"), "Downloads", "HumanCheck.txt"
-                        ),
+                        check_file=_HUMAN_CHECK_PATH,
                     )
+                    result_name = results[0].name
                     print(
-                        f"[info] Updated Excel row {i + args.start - 1} for '{company_name}' (SAP={sap or 'None'})"
+                        f"[info] Updated Excel row {args.row} for '{result_name}' "
+                        f"(SAP={args.sap_number or 'None'})"
                     )
 
-        # TODO: Single-shot mode
-        else:
-            if args.sap_number == "-1":
-                print("In single-shot mode you must provide --sap_number.")
-                return
-            if not args.schlagwoerter:
-                print("In single-shot mode you must provide --schlagwoerter.")
-                return
-            if args.row_number == "-1":
-                print("In single-shot mode you must provide --row_number.")
-                return
-            await perform_search(
-                args.schlagwoerter, args.schlagwortOptionen, register_number=args.register_number
-            )
-            results = await get_results()
-            if len(results) != 1:
-                # Write to HumanCheck.txt in Downloads
-                check_file = os.path.join(os.path.expanduser("~"), "Downloads", "HumanCheck.txt")
-                with open(check_file, "a") as f:
-                    f.write(
-                        f"\n\n[info] found {len(results)} result row(s) for '{args.schlagwoerter}'"
-                    )
-                #    for r in results:
-                #        f.write(f"\nname: {r['name']}")
-                #        f.write(f"\ncourt: {r['court']}")
-                #        f.write(f"\nstate/office: {r['registered_office']}")
-                #        f.write(f"\nstatus: {r['status']}")
-                #        f.write("\n")
-
-                print(
-                    "[warn] Found multiple results or none; check HumanCheck.txt in Downloads for details."
-                )
-                return
-            # check if only one result is found, if more TODO: interation already exists
+        finally:
+            pdf_pool.shutdown(wait=True)
 
-            path = None  # Initialize path to None
-            if args.download_ad and len(results) == 1:
-                # Process each row and click AD
-                for r in results:
-                    path = await download_ad_for_row(
-                        company_name=r["name"] or "company",
-                        outdir=args.outdir,
-                        sap_number=args.sap_number,  # No SAP number in this case TODO
-                        row_locator=r["row_locator"],  # currently not used
-                    )
-                    # Small pause to be gentle (adjust if needed)
-                    # await page.wait_for_timeout(1200)
-
-            if path is not None:
-                update_info = (
-                    pdf_scanner.extract_from_pdf(path)
-                    | {
-                        "company_name": results[0]["name"],
-                        "sap_number": args.sap_number,
-                        "download_path": path,
-                    }
-                )  # Extract fields from the downloaded PDF into a dict, override company_name with umlauts replaced
-                if update_info["register_type"] == "unexpected Format":
-                    print(
-                        f"[warn] Error, unexpected PDF Format '{results[0]['name']}' (SAP={args.sap_number or 'None'})"
-                    )
-                    excel_io.write_to_excel_error(
-                        path=args.excel,
-                        sheet=args.sheet,
-                        row=args.row_number,
-                        changes_check_col=args.changes_check_col,
-                        error_col=args.name1_col,
-                        error_msg="unexpected PDF Format",
-                        pdf_path=path,  # Save the path of PDF in excel
-                        pdf_path_col=args.doc_path_col,
-                    )
-                    return
-                excel_io.write_update_to_excel(
-                    path=args.excel,
-                    sheet=args.sheet,
-                    row=args.row_number,
-                    update_info=update_info,  # All info to update
-                    name_col=args.name1_col,  # Update column
-                    regno_col=args.regno_col,
-                    sap_supplier_col=args.sap_supplier_col,
-                    sap_customer_col=args.sap_customer_col,
-                    name2_col=args.name2_col,
-                    name3_col=args.name3_col,
-                    street_col=args.street_col,
-                    house_number_col=args.house_number_col,
-                    city_col=args.city_col,
-                    postal_code_col=args.postal_code_col,
-                    doc_path_col=args.doc_path_col,
-                    changes_check_col=args.changes_check_col,
-                    date_check_col=args.date_check_col,
-                    register_type_col=args.register_type_col,
-                    check_file=os.path.join(os.path.expanduser("~"), "Downloads", "HumanCheck.txt"),
-                )
-                result_name = results[0].get("name", "")
-                print(
-                    f"[info] Updated Excel row {args.row} for '{result_name}' "
-                    f"(SAP={args.sap_number or 'None'})"
-                )
-
-        await context.close()
+        for s in slots:
+            await s.context.close()
         await browser.close()
 
 
@@ -773,13 +1209,32 @@ def parse_args():
     parser.add_argument(
         "--outdir",
         help="Output directory for downloaded PDFs",
-        default=os.path.join(os.path.expanduser("~"), "Downloads", "BP"),
+        default=_DEFAULT_OUTDIR,
     )
     parser.add_argument(
         "--headful",
         help="Run with a visible browser window (useful for debugging).",
         action="store_true",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=(
+            "Excel mode: number of jobs processed in parallel, each in its own browser "
+            "context with a warm spare page for reruns (default 1). The 60 searches per "
+            "hour limit is shared by all workers."
+        ),
+    )
+    parser.add_argument(
+        "--skip-failed",
+        action="store_true",
+        help=(
+            "Excel mode: do not search again the jobs that an earlier run marked as error. "
+            f"Finished jobs are listed in <excel>.<sheet>{_CHECKPOINT_SUFFIX} next to the "
+            "workbook; delete it to start over."
+        ),
+    )
     parser.add_argument(
         "-rn",
         "--register-number",
@@ -2,26 +2,58 @@
 
 from __future__ import annotations
 
+import contextlib
+import csv
+import functools
+import io
+import logging
 import re
 import unicodedata
+from collections.abc import Generator, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TextIO
 
 import pandas as pd
 import pdfplumber
+import pypdfium2 as pdfium
 
 from .utils.logging_setup import setup_logger
 
+# Engine for the whole-document patterns FIRMA_LINE and GESCH_ADDR
+try:  # pragma: no cover - optional dependency
+    import re2 as _re_fulltext
+except ImportError:  # pragma: no cover - fallback to the stdlib engine
+    _re_fulltext = re
+
 _BASE_LOGGER = setup_logger()
 LOGGER = _BASE_LOGGER.getChild("pdf_scanner")
 
+# Pre-compiled patterns used per PDF (avoid the re-module cache lookup on every call)
+_FIRST_DIGIT = re.compile(r"\d")
+_HOUSE_NORM = re.compile(r"\d+\s+[A-Za-z]")
+_PLZ5 = re.compile(r"\s*(\d{5})\s+(.+)")
+_PLZ45 = re.compile(r"\s*(\d{4,5})\s+(.+)")
+_HYPH = re.compile(r"-\n(?=\w)")
+_MULTISPACE = re.compile(r" {2,}")
+_NONLETTER = re.compile(r"[^A-Za-zÄÖÜäöü]")
+_NONDIGIT = re.compile(r"[^\d]")
+_LINE_END = re.compile(r"\s*(?:\n|$)")
+# "2.a)" / "b)" / "2.b)" at the start of a line ([^\S\n] = whitespace except newline)
+_ANCHORS = re.compile(
+    r"^[^\S\n]*(?:2\.[^\S\n]*(?P<a>a)|(?:2\.[^\S\n]*)?b)\)", re.IGNORECASE | re.MULTILINE
+)
+_SEC_3 = re.compile(r"^\s*3\.", re.IGNORECASE)
+
 
 # --- helpers ---------------------------------------------------------------
+_UMLAUT_TABLE = str.maketrans({"Ö": "OE", "Ä": "AE", "Ü": "UE", "ß": "SS"})
+
+
+@functools.lru_cache(maxsize=4096)
 def replace_umlauts(text):
     """Replace German umlauts after uppercase conversion"""
-    replacements = {"STR.": "STRASSE", "Ö": "OE", "Ä": "AE", "Ü": "UE", "ß": "SS"}
-    for umlaut, replacement in replacements.items():
-        text = text.replace(umlaut, replacement)
-    return text
+    return text.replace("STR.", "STRASSE").translate(_UMLAUT_TABLE)
 
 
 def split_german_address(addr: str) -> dict:
@@ -29,6 +61,18 @@ def split_german_address(addr: str) -> dict:
     Zerlegt 'STRAßENNAME 12A, 12345 STADT' in {street, house_number, postal_code, city}.
     (Adressformat wie im Handelsregisterauszug unter 'Geschäftsanschrift')
     """
+    street, house, plz, city = _split_german_address(addr)
+    return {
+        "street": street,
+        "house_number": house,
+        "postal_code": plz,
+        "city": city,
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_german_address(addr: str) -> tuple[str, str, str, str]:
+    """Cached worker for split_german_address (addresses repeat across registrations)."""
 
     # 1) Links/Rechts um das erste Komma trennen
     if "," in addr:
@@ -41,7 +85,7 @@ def split_german_address(addr: str) -> dict:
     right = right.strip()
 
     # 2) Straße + Hausnummer: erste Ziffer in 'left' suchen
-    m = re.search(r"\d", left)
+    m = _FIRST_DIGIT.search(left)
     if m:
         street = left[: m.start()].strip()
         house = left[m.start() :].strip()
@@ -50,14 +94,14 @@ def split_german_address(addr: str) -> dict:
         street, house = left, ""
 
     # Hausnummer etwas normalisieren (z.B. "12 A" -> "12A"), aber nur wenn es passt
-    if re.fullmatch(r"\d+\s+[A-Za-z]", house):
+    if _HOUSE_NORM.fullmatch(house):
         house = house.replace(" ", "")
 
     # 3) Rechts: PLZ + Stadt
     # Primär: 5-stellige deutsche PLZ; Fallback erlaubt 4–5
-    m = re.match(r"\s*(\d{5})\s+(.+)", right)
+    m = _PLZ5.match(right)
     if not m:
-        m = re.match(r"\s*(\d{4,5})\s+(.+)", right)
+        m = _PLZ45.match(right)
 
     if m:
         plz = m.group(1)
@@ -67,33 +111,45 @@ def split_german_address(addr: str) -> dict:
         plz = ""
         city = right
 
-    return {
-        "street": street,
-        "house_number": house,
-        "postal_code": plz,
-        "city": city,
-    }
+    return street, house, plz, city
+
+
+_NORM_TABLE = str.maketrans({"\u00a0": " ", "\t": " ", "\r": "\n"})
 
 
 def normalize_text(s: str) -> str:
     """Normalize unicode & whitespace; fix common hyphenation at line breaks."""
     if not s:
         return ""
-    s = unicodedata.normalize("NFKC", s)
-    s = s.replace("\u00a0", " ")  # non-breaking space -> space
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = re.sub(r"-\n(?=\w)", "", s)  # remove hyphenations at line ends
-    s = re.sub(r"[ \t]+", " ", s)
+    s = unicodedata.normalize("NFKC", s).replace("\r\n", "\n")
+    s = s.translate(_NORM_TABLE)  # NBSP/tab -> space, lone CR -> LF
+    s = _HYPH.sub("", s)  # remove hyphenations at line ends
+    s = _MULTISPACE.sub(" ", s)
     return s
 
 
-FIRMA_LINE = re.compile(
-    r"\b2\.\s*a\)\s*Firma:\s*(.+)",  # capture only the first line after "Firma:"
-    re.IGNORECASE,
+def _first_lines(text: str, n: int) -> list[str]:
+    """Return the first ``n`` non-empty stripped lines without splitting the whole text."""
+    head: list[str] = []
+    start = 0
+    while len(head) < n and start <= len(text):
+        end = text.find("\n", start)
+        if end < 0:
+            end = len(text)
+        line = text[start:end].strip()
+        if line:
+            head.append(line)
+        start = end + 1
+    return head
+
+
+# These two scan the whole document text, so use google-re2 (linear-time DFA) when it is
+# installed (``pip install bpauto[re2]``). Both engines understand the inline (?i) flag.
+FIRMA_LINE = _re_fulltext.compile(
+    r"(?i)\b2\.\s*a\)\s*Firma:\s*(.+)",  # capture only the first line after "Firma:"
 )
-GESCH_ADDR = re.compile(
-    r"Gesch[aä]ftsanschrift:\s*(.+)",  # handle ä or ae
-    re.IGNORECASE,
+GESCH_ADDR = _re_fulltext.compile(
+    r"(?i)Gesch[aä]ftsanschrift:\s*(.+)",  # handle ä or ae
 )
 
 
@@ -105,12 +161,11 @@ def extract_from_text(text: str) -> dict:
     text = normalize_text(text)
 
     # 1) Register type + number (2nd line last 2 words)
-    lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
-    line2 = lines[1]
+    line2 = _first_lines(text, 2)[1]
     words = line2.split()
     w_type_raw, w_num_raw = words[-2], words[-1]
-    reg_type = re.sub(r"[^A-Za-zÄÖÜäöü]", "", w_type_raw).upper()
-    reg_number = re.sub(r"[^\d]", "", w_num_raw)
+    reg_type = _NONLETTER.sub("", w_type_raw).upper()
+    reg_number = _NONDIGIT.sub("", w_num_raw)
 
     # 2) Company name (section 2.a) Firma:)
     company = ""
@@ -129,7 +184,7 @@ def extract_from_text(text: str) -> dict:
         # take rest of the line after the label
         address = m.group(1).strip()
         # Sometimes address line ends with a page artifact; trim trailing section markers
-        address = re.sub(r"\s*(?:\n|$)", "", address)
+        address = _LINE_END.sub("", address)
     else:
         return extract_from_text_2nd_format(text)
     addr = replace_umlauts(address.upper())
@@ -156,10 +211,9 @@ def extract_from_text_2nd_format(text: str) -> dict:
     <street house, plz city>
     """
     t = normalize_text(text)
-    lines = [ln.strip() for ln in t.split("\n")]
 
     # 1) Register type & number (from 'Aktueller Ausdruck <TYPE> <NUMBER...>')
-    line3 = lines[3]
+    line3 = t.split("\n", 4)[3].strip()
     LOGGER.debug("Line 4 Format 2: %s", line3)
     words = line3.split()
     if int(words[-2]):
@@ -168,48 +222,44 @@ def extract_from_text_2nd_format(text: str) -> dict:
         w_num_raw = words[-2] + " " + words[-1]
     else:
         w_type_raw, w_num_raw = words[-2], words[-1]
-    reg_type = re.sub(r"[^A-Za-zÄÖÜäöü]", "", w_type_raw).upper()
+    reg_type = _NONLETTER.sub("", w_type_raw).upper()
     reg_number = w_num_raw
 
-    # 2) Company name: lines after "2.a)" up to "b)"
-    company = ""
-    idx_a = None
-    for i, ln in enumerate(lines):
-        if re.search(r"^\s*2\.\s*a\)", ln, flags=re.IGNORECASE):
-            idx_a = i
+    # Locate the "2.a)" and "b)" section anchors (line offsets) in one sweep
+    pos_a = pos_b = pos_b_after_a = None
+    for m in _ANCHORS.finditer(t):
+        if m.group("a"):
+            if pos_a is None:
+                pos_a = m.start()
+            continue
+        if pos_b is None:
+            pos_b = m.start()
+        if pos_a is not None:
+            pos_b_after_a = m.start()
             break
-    if idx_a is not None:
-        collected = []
-        for ln in lines[idx_a + 1 :]:
-            if re.search(r"^\s*(?:2\.\s*)?b\)", ln, flags=re.IGNORECASE):
-                break
-            if ln:
-                collected.append(ln)
-        company = " ".join(collected)
-    else:
+
+    # 2) Company name: lines after "2.a)" up to "b)"
+    if pos_a is None:
         return {reg_type: "unexpected Format"}
+    end_a = t.find("\n", pos_a)
+    body = t[end_a + 1 : pos_b_after_a] if end_a >= 0 else ""
+    company = " ".join(ln.strip() for ln in body.split("\n") if ln.strip())
 
     # 3) Address: section 2.b) — take the “third row” pattern, or only the city (if no street, i.e Vereine often don't have one)
-    address = ""
-    idx_b = None
-    for i, ln in enumerate(lines):
-        if re.search(r"^\s*(?:2\.\s*)?b\)\s*", ln, flags=re.IGNORECASE):
-            idx_b = i
-            break
-    if idx_b is not None:
-        if re.search(r"^\s*3\.", lines[idx_b + 2], flags=re.IGNORECASE):
-            # only city
-            city = lines[idx_b + 1].strip()
-            return {
-                "register_type": reg_type,
-                "register_number": reg_number,
-                "company_name": company,
-                "city": city,
-            }
-        else:
-            address = lines[idx_b + 2].strip()
-    else:
+    if pos_b is None:
         return {reg_type: "unexpected Format"}
+    end_b = t.find("\n", pos_b)
+    following = t[end_b + 1 :].split("\n", 2) if end_b >= 0 else []
+    if _SEC_3.search(following[1].strip()):
+        # only city
+        city = following[0].strip()
+        return {
+            "register_type": reg_type,
+            "register_number": reg_number,
+            "company_name": company,
+            "city": city,
+        }
+    address = following[1].strip()
 
     parts = split_german_address(replace_umlauts(address.upper()))
 
@@ -222,19 +272,96 @@ def extract_from_text_2nd_format(text: str) -> dict:
     }
 
 
+def _iter_page_texts(data: bytes) -> Generator[str, None, None]:
+    """Fast text path: plain page text from pdfium (no char/word objects are built)."""
+    pdf = pdfium.PdfDocument(data)
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_bounded()
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def _iter_page_texts_layout(data: bytes) -> Generator[str, None, None]:
+    """
+    Layout-aware text path via pdfplumber (slower, visual line order).
+    Each page drops its parsed objects right after extraction (Page.close,
+    pdfplumber >= 0.11), so memory stays at one page instead of the whole file.
+    """
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text(x_tolerance=1.5, y_tolerance=1.5) or ""
+            page.close()
+            yield text
+
+
+# Register types of the German common register portal (Handelsregister, Genossenschafts-,
+# Gesellschafts-, Partnerschafts- und Vereinsregister)
+_REGISTER_TYPES = {"HRA", "HRB", "GNR", "GSR", "PR", "VR"}
+_ADDRESS_FIELDS = ("address", "street", "postal_code", "city")
+
+
+def _is_complete(info: dict) -> bool:
+    """
+    Plausibility check for a result of the fast text path. The address counts too:
+    pdfium's content-stream order can tear the address line apart while the
+    register header still parses. Documents with only a city (Vereine without a
+    street, no "address" key) are complete with the city; the layout text could
+    not add a street either.
+    """
+    if not (
+        info.get("register_type") in _REGISTER_TYPES
+        and _FIRST_DIGIT.search(info.get("register_number", ""))
+        and info.get("company_name")
+    ):
+        return False
+    if "address" not in info:
+        return bool(info.get("city"))
+    return all(info.get(key) for key in _ADDRESS_FIELDS)
+
+
+def _extract_from_pages(pages: Generator[str, None, None]) -> dict:
+    """
+    Run the extractor on page 1 only; the remaining pages are read (and the
+    extractor re-run on the full text) only if fields are missing.
+    """
+    try:
+        first = next(pages, "")
+        try:
+            info = extract_from_text(first)
+            if _is_complete(info):
+                return info
+        except Exception:
+            pass
+        return extract_from_text("\n".join([first, *pages]))
+    finally:
+        pages.close()
+
+
 def extract_from_pdf(pdf_path: Path) -> dict:
     """
-    Read all pages’ text (order-preserving) and run extractor once on full text.
-    Most documents you showed keep everything on page 1, but this is safer.
+    Extract the fields from page 1; further pages are only read when needed.
+    Most documents you showed keep everything on page 1.
+
+    The text is read with pdfium first; pdfium returns content-stream order, so if
+    that result is incomplete the PDF is re-parsed with pdfplumber's layout analysis.
+    The file itself is read once, in a single call, and both parsers work from memory.
     """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            pages_text = []
-            for page in pdf.pages:
-                t = page.extract_text(x_tolerance=1.5, y_tolerance=1.5) or ""
-                pages_text.append(t)
-        full_text = "\n".join(pages_text)
-        info = extract_from_text(full_text)
+        data = Path(pdf_path).read_bytes()
+        try:
+            info = _extract_from_pages(_iter_page_texts(data))
+        except Exception as e:
+            LOGGER.debug("Fast text path failed for %s: %s", pdf_path, e)
+            info = {}
+        if not _is_complete(info):
+            info = _extract_from_pages(_iter_page_texts_layout(data))
         info["file"] = str(pdf_path)
         return info
     except Exception as e:
@@ -250,35 +377,76 @@ def extract_from_pdf(pdf_path: Path) -> dict:
 
 # --- batch runner ----------------------------------------------------------
 
+SCAN_COLUMNS = [
+    "file",
+    "register_type",
+    "register_number",
+    "company_name",
+    "address",
+    "error",
+    "street",
+    "house_number",
+    "postal_code",
+    "city",
+]
+
+
+def iter_scan_directory(in_dir: str, max_workers: int | None = None) -> Iterator[dict]:
+    """
+    Yield the extracted fields of every PDF in a directory as soon as it is parsed.
 
-def scan_directory(in_dir: str, out_csv: str | None = None) -> pd.DataFrame:
+    PDFs are parsed in a process pool (one worker per CPU unless ``max_workers``
+    is given); the order still follows the sorted file names.
+    """
+    files = sorted(Path(in_dir).glob("*.pdf"))
+    # workers re-import this module (spawn), so hand them the current log level
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=setup_logger, initargs=(_BASE_LOGGER.level,)
+    ) as pool:
+        yield from pool.map(extract_from_pdf, files, chunksize=8)
+
+
+def _csv_writer(handle: TextIO) -> csv.DictWriter:
+    writer = csv.DictWriter(handle, fieldnames=SCAN_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    return writer
+
+
+def scan_directory_to_csv(in_dir: str, out_csv: str, max_workers: int | None = None) -> int:
+    """
+    Scan all PDFs in a directory and stream one CSV row per PDF without keeping
+    the results in memory. Returns the number of rows written.
+    """
+    Path(out_csv).parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(out_csv, "w", newline="", encoding="utf-8") as fh:
+        writer = _csv_writer(fh)
+        for info in iter_scan_directory(in_dir, max_workers):
+            writer.writerow(info)
+            count += 1
+    return count
+
+
+def scan_directory(
+    in_dir: str, out_csv: str | None = None, max_workers: int | None = None
+) -> pd.DataFrame:
     """
     Scan all PDFs in a directory and return a DataFrame with the extracted fields.
-    Optionally write a CSV for inspection.
+    Optionally write a CSV for inspection (rows are written as each PDF completes).
     """
-    in_dir = Path(in_dir)
-    rows = []
-    for p in sorted(in_dir.glob("*.pdf")):
-        rows.append(extract_from_pdf(p))
-    df = pd.DataFrame(
-        rows,
-        columns=[
-            "file",
-            "register_type",
-            "register_number",
-            "company_name",
-            "address",
-            "error",
-            "street",
-            "house_number",
-            "postal_code",
-            "city",
-        ],
-    )
-    if out_csv:
-        Path(out_csv).parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(out_csv, index=False, encoding="utf-8")
-    return df
+    columns: dict[str, list] = {c: [] for c in SCAN_COLUMNS}
+    with contextlib.ExitStack() as stack:
+        writer = None
+        if out_csv:
+            Path(out_csv).parent.mkdir(parents=True, exist_ok=True)
+            fh = stack.enter_context(open(out_csv, "w", newline="", encoding="utf-8"))
+            writer = _csv_writer(fh)
+        for info in iter_scan_directory(in_dir, max_workers):
+            if writer is not None:
+                writer.writerow(info)
+            for c, values in columns.items():
+                values.append(info.get(c))
+    return pd.DataFrame(columns)
 
 
 # --- CLI -------------------------------------------------------------------
@@ -289,19 +457,21 @@ if __name__ == "__main__":
     ap = argparse.ArgumentParser(description="Extract Handelsregister fields from PDFs.")
     ap.add_argument("--in", dest="in_dir", required=True, help="Folder with downloaded PDFs")
     ap.add_argument("--out", dest="out_csv", default=None, help="Optional CSV path to save results")
+    ap.add_argument("--verbose", action="store_true", help="Enable debug logging")
     args = ap.parse_args()
+    setup_logger(level=logging.DEBUG if args.verbose else logging.INFO)
 
     df = scan_directory(args.in_dir, args.out_csv)
     # Print a compact preview to console
-    for _, r in df.iterrows():
-        LOGGER.info("\nFile: %s", r["file"])
-        if isinstance(r.get("error"), str) and r["error"]:
-            LOGGER.error("  ERROR: %s", r["error"])
+    for r in df.itertuples(index=False):
+        LOGGER.info("\nFile: %s", r.file)
+        if isinstance(r.error, str) and r.error:
+            LOGGER.error("  ERROR: %s", r.error)
             continue
-        LOGGER.info("  Register: %s %s", r["register_type"], r["register_number"])
-        LOGGER.info("  Company : %s", r["company_name"])
-        LOGGER.info("  Address : %s", r["address"])
-        LOGGER.info("  Street  : %s", r["street"])
-        LOGGER.info("  House # : %s", r["house_number"])
-        LOGGER.info("  Postal Code: %s", r["postal_code"])
-        LOGGER.info("  City    : %s", r["city"])
+        LOGGER.info("  Register: %s %s", r.register_type, r.register_number)
+        LOGGER.info("  Company : %s", r.company_name)
+        LOGGER.info("  Address : %s", r.address)
+        LOGGER.info("  Street  : %s", r.street)
+        LOGGER.info("  House # : %s", r.house_number)
+        LOGGER.info("  Postal Code: %s", r.postal_code)
+        LOGGER.info("  City    : %s", r.city)
@@ -142,6 +142,97 @@ def test_write_and_save(tmp_path: Path) -> None:
     assert sheet["AD3"].value == "northdata_api"
 
 
+def _update_row(excel_path: Path, sap_number: str, check_file: Path) -> bool:
+    return excel_io.write_update_to_excel(
+        path=str(excel_path),
+        sheet="Daten",
+        row=3,
+        update_info={
+            "company_name": "EXAMPLE GMBH",
+            "sap_number": sap_number,
+            "street": "MUSTERSTRASSE",
+            "register_type": "HRB",
+            "register_number": "12345",
+        },
+        name_col="T",
+        regno_col="U",
+        sap_supplier_col="A",
+        sap_customer_col="B",
+        name2_col=None,
+        name3_col=None,
+        street_col="X",
+        house_number_col="Y",
+        city_col="Z",
+        postal_code_col="AA",
+        doc_path_col="P",
+        changes_check_col="Q",
+        date_check_col="S",
+        register_type_col="V",
+        check_file=str(check_file),
+    )
+
+
+def test_write_update_to_excel_checks_sap_from_workbook(tmp_path: Path) -> None:
+    excel_path = tmp_path / "update.xlsx"
+    _create_workbook(excel_path)
+    workbook = load_workbook(excel_path)
+    workbook["Daten"]["B3"] = 4711
+    workbook.save(excel_path)
+    check_file = tmp_path / "HumanCheck.txt"
+
+    assert _update_row(excel_path, "4711", check_file) is True
+    assert _update_row(excel_path, "999", check_file) is False
+    excel_io.save(str(excel_path))
+
+    sheet = load_workbook(excel_path)["Daten"]
+    assert sheet["T3"].value == "EXAMPLE GMBH"
+    assert sheet["X3"].value == "MUSTERSTRASSE"
+    assert sheet["U3"].value == "12345"
+    # the mismatch of the second call only flags the row
+    assert sheet["Q3"].value == "yes"
+    assert "SAP mismatch at row 3" in check_file.read_text(encoding="utf-8")
+
+
+def test_read_jobs_from_excel_reads_requested_rows(tmp_path: Path) -> None:
+    excel_path = tmp_path / "jobs.xlsx"
+    _create_workbook(excel_path)
+    workbook = load_workbook(excel_path)
+    workbook["Daten"]["U3"] = 12038
+    workbook["Daten"]["A5"] = 123
+    workbook.save(excel_path)
+
+    jobs = excel_io.read_jobs_from_excel(
+        path=str(excel_path),
+        sheet="Daten",
+        name_col="C",
+        regno_col="U",
+        sap_supplier_col="A",
+        sap_customer_col="B",
+        postal_code_col="AA",
+        country_col="AC",
+        start=3,
+        end=5,
+    )
+
+    assert jobs == [
+        {
+            "name": "Example GmbH",
+            "register_no": "12038",
+            "sap": None,
+            "postal_code": "80333",
+            "country": "DE",
+        },
+        {"name": None, "register_no": None, "sap": None, "postal_code": None, "country": None},
+        {
+            "name": "Another AG",
+            "register_no": None,
+            "sap": "123",
+            "postal_code": "10115",
+            "country": None,
+        },
+    ]
+
+
 def test_missing_sheet_raises(tmp_path: Path) -> None:
     excel_path = tmp_path / "missing.xlsx"
     _create_workbook(excel_path)
@@ -156,3 +247,28 @@ def test_missing_sheet_raises(tmp_path: Path) -> None:
                 name_col="C",
             )
         )
+
+
+def test_read_jobs_from_excel_drops_trailing_empty_rows(tmp_path: Path) -> None:
+    excel_path = tmp_path / "jobs.xlsx"
+    _create_workbook(excel_path)
+    workbook = load_workbook(excel_path)
+    workbook["Daten"]["C5000"] = None  # bläht die gespeicherte Blattgröße auf
+    workbook.save(excel_path)
+    columns = {
+        "path": str(excel_path),
+        "sheet": "Daten",
+        "name_col": "C",
+        "regno_col": "U",
+        "sap_supplier_col": "A",
+        "sap_customer_col": "B",
+        "postal_code_col": "AA",
+        "country_col": "AC",
+    }
+
+    jobs = excel_io.read_jobs_from_excel(**columns, start=3, end=None)
+    beyond_data = excel_io.read_jobs_from_excel(**columns, start=10, end=None)
+
+    assert [job["name"] for job in jobs] == ["Example GmbH", None, "Another AG"]
+    assert beyond_data == []
+
@@ -1,4 +1,58 @@
-# mypy: ignore-errors
-import pytest
+from __future__ import annotations
 
-pytest.skip("Legacy Handelsregister parser test skipped", allow_module_level=True)
+import json
+from pathlib import Path
+
+from bpauto import handelsregister
+
+
+def _job(
+    name: str | None, sap: str | None = None, country: str | None = "DE"
+) -> dict[str, str | None]:
+    return {
+        "name": name,
+        "register_no": None,
+        "sap": sap,
+        "postal_code": None,
+        "country": country,
+    }
+
+
+def _write_checkpoint(path: Path, *entries: tuple[str, str]) -> None:
+    lines = [json.dumps({"key": key, "status": status}) for key, status in entries]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_checkpoint_path_is_scoped_to_workbook_and_sheet(tmp_path: Path) -> None:
+    excel = str(tmp_path / "Liste.xlsx")
+
+    assert handelsregister.checkpoint_path(excel, "Tabelle1") == excel + ".Tabelle1.done.jsonl"
+    assert handelsregister.checkpoint_path(excel, None) == excel + ".done.jsonl"
+
+
+def test_job_key_keeps_duplicate_companies_apart() -> None:
+    job = _job("Example GmbH", sap="12038")
+
+    assert handelsregister.job_key(3, job) == "3:12038"
+    assert handelsregister.job_key(7, job) != handelsregister.job_key(3, job)
+    assert handelsregister.job_key(4, _job("Example GmbH")) == "4:Example GmbH|"
+
+
+def test_load_checkpoint_retries_failed_jobs_unless_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.xlsx.done.jsonl"
+    _write_checkpoint(path, ("3:1", "ok"), ("4:2", "fail"), ("5:3", "fail"), ("5:3", "ok"))
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"key": "6:4", "sta')  # cut off by a crash
+
+    assert handelsregister.load_checkpoint(str(path)) == {"3:1", "5:3"}
+    assert handelsregister.load_checkpoint(str(path), skip_failed=True) == {"3:1", "4:2", "5:3"}
+    assert handelsregister.load_checkpoint(str(tmp_path / "missing.jsonl")) == set()
+
+
+def test_searchable_jobs_resumes_by_row(tmp_path: Path) -> None:
+    jobs = [_job("A", sap="1"), _job("A", sap="1"), _job(None), _job("B", country="AT")]
+
+    pending = handelsregister.searchable_jobs(jobs, {"3:1"}, start=3)
+
+    # same SAP one row further down is a job of its own
+    assert pending == [(2, jobs[1])]
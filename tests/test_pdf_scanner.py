@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from bpauto import pdf_scanner
+
+README_PDF = Path(__file__).resolve().parents[1] / "README.pdf"
+
+HRB_TEXT = """Handelsregister B des Amtsgerichts München
+Aktueller Ausdruck HRB 12038
+Abruf vom 01.01.2024
+1. Anzahl der bisherigen Eintragungen: 5
+2.a) Firma: Example GmbH
+b) Sitz, Niederlassung, Zweigniederlassungen:
+München
+Geschäftsanschrift: Musterstraße 12 A, 80333 München
+3. Gegenstand des Unternehmens:
+"""
+
+VR_TEXT = """Ausdruck - Vereinsregister - VR 601 SE
+Abruf vom 01.01.2024
+Amtsgericht Musterstadt
+Aktueller Ausdruck VR 601 SE
+1. Anzahl der bisherigen Eintragungen: 2
+2.a) Name des Vereins
+Sportverein Beispiel e.V.
+b) Sitz des Vereins
+Musterstadt
+Hauptstr. 5, 12345 Musterstadt
+3. Vertretungsberechtigung
+"""
+
+
+def test_split_german_address() -> None:
+    parts = pdf_scanner.split_german_address("HAUPTSTRASSE 12 A, 80333 MUENCHEN")
+
+    assert parts == {
+        "street": "HAUPTSTRASSE",
+        "house_number": "12A",
+        "postal_code": "80333",
+        "city": "MUENCHEN",
+    }
+
+
+def test_normalize_text_joins_hyphenation_and_collapses_whitespace() -> None:
+    text = "Muster-\r\nstraße \t 1\r2"
+
+    assert pdf_scanner.normalize_text(text) == "Musterstraße 1\n2"
+
+
+def test_extract_from_text_handelsregister_format() -> None:
+    info = pdf_scanner.extract_from_text(HRB_TEXT)
+
+    assert info["register_type"] == "HRB"
+    assert info["register_number"] == "12038"
+    assert info["company_name"] == "Example GmbH"
+    assert info["address"] == "MUSTERSTRASSE 12 A, 80333 MUENCHEN"
+    assert info["street"] == "MUSTERSTRASSE"
+    assert info["house_number"] == "12A"
+    assert info["postal_code"] == "80333"
+    assert info["city"] == "MUENCHEN"
+
+
+def test_extract_from_text_falls_back_to_vereinsregister_format() -> None:
+    info = pdf_scanner.extract_from_text(VR_TEXT)
+
+    assert info["register_type"] == "VR"
+    assert info["register_number"] == "601 SE"
+    assert info["company_name"] == "Sportverein Beispiel e.V."
+    assert info["street"] == "HAUPTSTRASSE"
+    assert info["house_number"] == "5"
+    assert info["postal_code"] == "12345"
+    assert info["city"] == "MUSTERSTADT"
+
+
+def test_extract_from_pdf_falls_back_to_layout_text(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    pdf_path = tmp_path / "dummy.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    # pdfium yields content-stream order; here the footer ends up on line 2
+    fast_text = "Handelsregister B\nSeite 1 von 3\n" + HRB_TEXT.split("\n", 2)[2]
+    layout_calls: list[bytes] = []
+
+    def fake_layout(data: bytes) -> Iterator[str]:
+        layout_calls.append(data)
+        yield HRB_TEXT
+
+    def fake_fast(data: bytes) -> Iterator[str]:
+        yield fast_text
+
+    monkeypatch.setattr(pdf_scanner, "_iter_page_texts", fake_fast)
+    monkeypatch.setattr(pdf_scanner, "_iter_page_texts_layout", fake_layout)
+
+    info = pdf_scanner.extract_from_pdf(pdf_path)
+
+    assert layout_calls == [b"%PDF-1.4"]
+    assert info["register_type"] == "HRB"
+    assert info["register_number"] == "12038"
+    assert info["file"] == str(pdf_path)
+
+
+def test_extract_from_pdf_falls_back_when_fast_address_is_broken(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    pdf_path = tmp_path / "dummy.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    # register header intact, but postal code and city end up after the address line
+    fast_text = (
+        HRB_TEXT.replace("Musterstraße 12 A, 80333 München", "Musterstraße 12 A,")
+        + "80333 München\n"
+    )
+    layout_calls: list[bytes] = []
+
+    def fake_fast(data: bytes) -> Iterator[str]:
+        yield fast_text
+
+    def fake_layout(data: bytes) -> Iterator[str]:
+        layout_calls.append(data)
+        yield HRB_TEXT
+
+    monkeypatch.setattr(pdf_scanner, "_iter_page_texts", fake_fast)
+    monkeypatch.setattr(pdf_scanner, "_iter_page_texts_layout", fake_layout)
+
+    info = pdf_scanner.extract_from_pdf(pdf_path)
+
+    assert layout_calls == [b"%PDF-1.4"]
+    assert info["postal_code"] == "80333"
+    assert info["city"] == "MUENCHEN"
+
+
+def test_extract_from_pdf_keeps_fast_result_without_street(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    pdf_path = tmp_path / "dummy.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    # Verein with only the city under "Sitz des Vereins", no street line
+    city_only = VR_TEXT.replace("Hauptstr. 5, 12345 Musterstadt\n", "")
+    layout_calls: list[bytes] = []
+
+    def fake_fast(data: bytes) -> Iterator[str]:
+        yield city_only
+
+    def fake_layout(data: bytes) -> Iterator[str]:
+        layout_calls.append(data)
+        yield city_only
+
+    monkeypatch.setattr(pdf_scanner, "_iter_page_texts", fake_fast)
+    monkeypatch.setattr(pdf_scanner, "_iter_page_texts_layout", fake_layout)
+
+    info = pdf_scanner.extract_from_pdf(pdf_path)
+
+    assert layout_calls == []
+    assert info["register_type"] == "VR"
+    assert info["city"] == "Musterstadt"
+
+
+def test_extract_from_pdf_stops_after_complete_first_page(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    pdf_path = tmp_path / "dummy.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    pages_read: list[int] = []
+
+    def fake_fast(data: bytes) -> Iterator[str]:
+        for number, text in enumerate([HRB_TEXT, "Seite 2", "Seite 3"], 1):
+            pages_read.append(number)
+            yield text
+
+    monkeypatch.setattr(pdf_scanner, "_iter_page_texts", fake_fast)
+
+    info = pdf_scanner.extract_from_pdf(pdf_path)
+
+    assert pages_read == [1]
+    assert info["company_name"] == "Example GmbH"
+    assert info["city"] == "MUENCHEN"
+
+
+def test_scan_directory_collects_rows_and_writes_csv(tmp_path: Path) -> None:
+    in_dir = tmp_path / "pdfs"
+    in_dir.mkdir()
+    shutil.copy(README_PDF, in_dir / "b.pdf")
+    shutil.copy(README_PDF, in_dir / "a.pdf")
+    out_csv = tmp_path / "out" / "result.csv"
+
+    df = pdf_scanner.scan_directory(str(in_dir), str(out_csv), max_workers=2)
+
+    assert list(df.columns) == pdf_scanner.SCAN_COLUMNS
+    assert [Path(f).name for f in df["file"]] == ["a.pdf", "b.pdf"]
+    # README.pdf is not a register printout, so both rows carry an error
+    assert df["error"].str.len().gt(0).all()
+    assert out_csv.read_text(encoding="utf-8").startswith(",".join(pdf_scanner.SCAN_COLUMNS))
+
+
+def test_scan_directory_to_csv_streams_rows(tmp_path: Path) -> None:
+    in_dir = tmp_path / "pdfs"
+    in_dir.mkdir()
+    shutil.copy(README_PDF, in_dir / "a.pdf")
+    out_csv = tmp_path / "result.csv"
+
+    count = pdf_scanner.scan_directory_to_csv(str(in_dir), str(out_csv), max_workers=1)
+
+    lines = out_csv.read_text(encoding="utf-8").splitlines()
+    assert count == 1
+    assert lines[0] == ",".join(pdf_scanner.SCAN_COLUMNS)
+    assert lines[1].startswith(str(in_dir / "a.pdf"))